@@ -1,51 +1,16 @@
-import json
 import os
 
+from command_file_parser import load_db, parse_cmd_file, save_db
+
 
 def parse_command_file_with_prefix(file_path: str, data: dict):
     """Parse command file that has numeric prefixes like '1-sim/MH/ClickFromXP'"""
-    added_count = 0
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-
-                # Skip empty lines, headers, lines with pipes
-                if (
-                    not line
-                    or line.startswith("#")
-                    or "|" in line
-                    or line.isdigit()
-                    or not line.startswith("1-")
-                ):
-                    continue
-
-                # Remove the '1-' prefix
-                if line.startswith("1-"):
-                    cmd_name = line[2:].strip()
-                else:
-                    cmd_name = line.strip()
-
-                # Find first space to separate name from description
-                if " " in cmd_name:
-                    first_space = cmd_name.find(" ")
-                    name = cmd_name[:first_space].strip()
-                    description = cmd_name[first_space:].strip()
-                else:
-                    name = cmd_name
-                    description = "Command"
-
-                # Add to database if not already present
-                if name not in data:
-                    data[name] = {
-                        "name": name,
-                        "type": "command",
-                        "description": description,
-                        "units": "",
-                        "writable": False,
-                    }
-                    added_count += 1
-                    print(f"Added command: {name}")
+        new_entries, _ = parse_cmd_file(file_path, data, prefixes=("1-",))
+        for name in new_entries:
+            print(f"Added command: {name}")
+        data.update(new_entries)
+        added_count = len(new_entries)
 
         print(f"Added {added_count} commands from {file_path}")
         return added_count
@@ -60,8 +25,7 @@ def add_missing_commands():
 
     # Load current database
     db_path = "resources/dataref_database.json"
-    with open(db_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_db(db_path)
 
     current_commands = sum(1 for v in data.values() if v.get("type") == "command")
     print(f"Current database has {current_commands} commands")
@@ -79,17 +43,13 @@ def add_missing_commands():
     print(f"\\nTotal new commands added: {total_added}")
     print("Saving updated database...")
 
-    with open(db_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    save_db(db_path, data)
 
     print("Database updated successfully!")
 
-    # Final verification
-    with open(db_path, "r", encoding="utf-8") as f:
-        updated_data = json.load(f)
-
-    final_commands = sum(1 for v in updated_data.values() if v.get("type") == "command")
-    final_total = len(updated_data)
+    # Final verification (in-memory data is what was just written)
+    final_total = len(data)
+    final_commands = current_commands + total_added
 
     print(f"\\n=== FINAL VERIFICATION ===")
     print(f"Total entries: {final_total}")
@@ -100,7 +60,7 @@ def add_missing_commands():
     print("\\nSample new commands:")
     new_commands = [
         (k, v)
-        for k, v in updated_data.items()
+        for k, v in data.items()
         if v.get("type") == "command" and k.startswith("sim/MH/")
     ]
 
@@ -14,8 +14,70 @@ in the Arduino-to-PC communication protocol:
 
 import re
 import json
+import logging
 from typing import Dict, Any, List, Tuple, Optional
 
+log = logging.getLogger(__name__)
+
+
+def _is_word(token: str) -> bool:
+    """Same test as the regex \\w+ used for INPUT/ACK keys"""
+    return token.replace('_', 'a').isalnum()
+
+
+# Builders turning the fields of each message type into a parsed dict
+def _build_input(groups: Tuple[str, ...]) -> Dict[str, Any]:
+    return {'type': 'INPUT', 'key': groups[0], 'value': groups[1]}
+
+
+def _build_cmd(groups: Tuple[str, ...]) -> Dict[str, Any]:
+    return {'type': 'CMD', 'command': groups[0]}
+
+
+def _build_dref(groups: Tuple[str, ...]) -> Dict[str, Any]:
+    return {'type': 'DREF', 'dataref': groups[0], 'value': groups[1]}
+
+
+def _build_ack(groups: Tuple[str, ...]) -> Dict[str, Any]:
+    return {'type': 'ACK', 'key': groups[0], 'value': groups[1]}
+
+
+def _build_value(groups: Tuple[str, ...]) -> Dict[str, Any]:
+    return {'type': 'VALUE', 'dataref': groups[0], 'value': groups[1]}
+
+
+def _build_arrayvalue(groups: Tuple[str, ...]) -> Dict[str, Any]:
+    return {
+        'type': 'ARRAYVALUE',
+        'array_name': groups[0],
+        'data_type': groups[1],
+        'values': [val.strip() for val in groups[2].split(',')]
+    }
+
+
+def _build_elemvalue(groups: Tuple[str, ...]) -> Dict[str, Any]:
+    # Split "arrayname[0]"; the ELEMVALUE pattern already guarantees this shape
+    token = groups[0]
+    lb = token.rfind('[')
+    return {
+        'type': 'ELEMVALUE',
+        'array_name': token[:lb],
+        'index': int(token[lb + 1:-1]),
+        'data_type': groups[1],
+        'value': groups[2]
+    }
+
+
+_BUILDERS = {
+    'INPUT': _build_input,
+    'CMD': _build_cmd,
+    'DREF': _build_dref,
+    'ACK': _build_ack,
+    'VALUE': _build_value,
+    'ARRAYVALUE': _build_arrayvalue,
+    'ELEMVALUE': _build_elemvalue,
+}
+
 
 class MessageParser:
     """
@@ -33,66 +95,41 @@ class MessageParser:
             'ARRAYVALUE': r'^ARRAYVALUE\s+(\w+)\s+(\w+)\s+(.+)$',
             'ELEMVALUE': r'^ELEMVALUE\s+(\w+\[\d+\])\s+(\w+)\s+(.+)$'
         }
+        
+        # Only the structured array messages still need a regex
+        self._regex_dispatch = {
+            msg_type: (re.compile(self.patterns[msg_type]), _BUILDERS[msg_type])
+            for msg_type in ('ARRAYVALUE', 'ELEMVALUE')
+        }
     
     def parse_message(self, message: str) -> Optional[Dict[str, Any]]:
         """
         Parse an incoming message and return its type and components
         """
         message = message.strip()
-        
-        for msg_type, pattern in self.patterns.items():
-            match = re.match(pattern, message)
+        parts = message.split(None, 2)
+        if len(parts) < 2:
+            return None
+        msg_type = parts[0]
+        
+        # Simple "<TYPE> <field> <rest>" messages are split instead of regex-matched
+        if msg_type == 'CMD':
+            return _build_cmd((message.split(None, 1)[1],))
+        if msg_type in ('INPUT', 'ACK'):
+            if len(parts) == 3 and _is_word(parts[1]):
+                return _BUILDERS[msg_type]((parts[1], parts[2]))
+            return None
+        if msg_type in ('DREF', 'VALUE'):
+            if len(parts) == 3:
+                return _BUILDERS[msg_type]((parts[1], parts[2]))
+            return None
+        
+        entry = self._regex_dispatch.get(msg_type)
+        if entry:
+            pattern, builder = entry
+            match = pattern.match(message)
             if match:
-                groups = match.groups()
-                
-                if msg_type == 'INPUT':
-                    return {
-                        'type': 'INPUT',
-                        'key': groups[0],
-                        'value': groups[1]
-                    }
-                elif msg_type == 'CMD':
-                    return {
-                        'type': 'CMD',
-                        'command': groups[0]
-                    }
-                elif msg_type == 'DREF':
-                    return {
-                        'type': 'DREF',
-                        'dataref': groups[0],
-                        'value': groups[1]
-                    }
-                elif msg_type == 'ACK':
-                    return {
-                        'type': 'ACK',
-                        'key': groups[0],
-                        'value': groups[1]
-                    }
-                elif msg_type == 'VALUE':
-                    return {
-                        'type': 'VALUE',
-                        'dataref': groups[0],
-                        'value': groups[1]
-                    }
-                elif msg_type == 'ARRAYVALUE':
-                    return {
-                        'type': 'ARRAYVALUE',
-                        'array_name': groups[0],
-                        'data_type': groups[1],
-                        'values': [val.strip() for val in groups[2].split(',')]
-                    }
-                elif msg_type == 'ELEMVALUE':
-                    # Extract array name and index from format like "arrayname[0]"
-                    array_match = re.match(r'(\w+)\[(\d+)\]', groups[0])
-                    if array_match:
-                        array_name, index = array_match.groups()
-                        return {
-                            'type': 'ELEMVALUE',
-                            'array_name': array_name,
-                            'index': int(index),
-                            'data_type': groups[1],
-                            'value': groups[2]
-                        }
+                return builder(match.groups())
         
         # If no pattern matches, return None
         return None
@@ -108,6 +145,17 @@ class ArduinoMessageHandler:
         self.variables = {}
         self.datarefs = {}
         self.arrays = {}
+        
+        # Message type -> handler method
+        self._handlers = {
+            'INPUT': self.handle_input,
+            'CMD': self.handle_cmd,
+            'DREF': self.handle_dref,
+            'ACK': self.handle_ack,
+            'VALUE': self.handle_value,
+            'ARRAYVALUE': self.handle_arrayvalue,
+            'ELEMVALUE': self.handle_elemvalue,
+        }
     
     def handle_message(self, message: str) -> bool:
         """
@@ -116,27 +164,11 @@ class ArduinoMessageHandler:
         parsed_msg = self.parser.parse_message(message)
         
         if not parsed_msg:
-            print(f"Unknown message format: {message}")
+            log.warning("Unknown message format: %s", message)
             return False
         
-        msg_type = parsed_msg['type']
-        
-        if msg_type == 'INPUT':
-            return self.handle_input(parsed_msg)
-        elif msg_type == 'CMD':
-            return self.handle_cmd(parsed_msg)
-        elif msg_type == 'DREF':
-            return self.handle_dref(parsed_msg)
-        elif msg_type == 'ACK':
-            return self.handle_ack(parsed_msg)
-        elif msg_type == 'VALUE':
-            return self.handle_value(parsed_msg)
-        elif msg_type == 'ARRAYVALUE':
-            return self.handle_arrayvalue(parsed_msg)
-        elif msg_type == 'ELEMVALUE':
-            return self.handle_elemvalue(parsed_msg)
-        
-        return False
+        handler = self._handlers.get(parsed_msg['type'])
+        return handler(parsed_msg) if handler else False
     
     def handle_input(self, msg: Dict[str, Any]) -> bool:
         """
@@ -146,7 +178,7 @@ class ArduinoMessageHandler:
         key = msg['key']
         value = msg['value']
         
-        print(f"Input received: {key} = {value}")
+        log.debug("Input received: %s = %s", key, value)
         
         # Store the input value in variables
         self.variables[key] = value
@@ -168,7 +200,7 @@ class ArduinoMessageHandler:
         """
         command = msg['command']
         
-        print(f"Command received: {command}")
+        log.debug("Command received: %s", command)
         
         # Execute the command
         if command == 'RESET':
@@ -178,7 +210,7 @@ class ArduinoMessageHandler:
         elif command.startswith('SET_MODE'):
             self.set_mode(command.split(' ', 1)[1])
         else:
-            print(f"Unknown command: {command}")
+            log.warning("Unknown command: %s", command)
             return False
         
         return True
@@ -191,7 +223,7 @@ class ArduinoMessageHandler:
         dataref = msg['dataref']
         value = msg['value']
         
-        print(f"Dataref write: {dataref} = {value}")
+        log.debug("Dataref write: %s = %s", dataref, value)
         
         # Send the dataref value to X-Plane
         self.send_to_xplane(dataref, value)
@@ -209,15 +241,15 @@ class ArduinoMessageHandler:
         key = msg['key']
         value = msg['value']
         
-        print(f"Acknowledgment: {key} = {value}")
+        log.debug("Acknowledgment: %s = %s", key, value)
         
         # Process acknowledgment based on the key
         if key == 'INIT':
-            print("Arduino initialization acknowledged")
+            log.debug("Arduino initialization acknowledged")
         elif key == 'CONFIG':
-            print(f"Configuration acknowledged: {value}")
+            log.debug("Configuration acknowledged: %s", value)
         elif key.startswith('WRITE'):
-            print(f"Write operation acknowledged: {value}")
+            log.debug("Write operation acknowledged: %s", value)
         
         return True
     
@@ -229,7 +261,7 @@ class ArduinoMessageHandler:
         dataref = msg['dataref']
         value = msg['value']
         
-        print(f"Dataref value reported: {dataref} = {value}")
+        log.debug("Dataref value reported: %s = %s", dataref, value)
         
         # Store the reported value
         self.datarefs[dataref] = value
@@ -248,7 +280,7 @@ class ArduinoMessageHandler:
         data_type = msg['data_type']
         values = msg['values']
         
-        print(f"Array value reported: {array_name} ({data_type}) = {values}")
+        log.debug("Array value reported: %s (%s) = %s", array_name, data_type, values)
         
         # Convert values based on type
         converted_values = self.convert_values(values, data_type)
@@ -274,7 +306,7 @@ class ArduinoMessageHandler:
         data_type = msg['data_type']
         value = msg['value']
         
-        print(f"Array element value: {array_name}[{index}] ({data_type}) = {value}")
+        log.debug("Array element value: %s[%d] (%s) = %s", array_name, index, data_type, value)
         
         # Convert value based on type
         converted_value = self.convert_single_value(value, data_type)
@@ -283,12 +315,14 @@ class ArduinoMessageHandler:
         if array_name not in self.arrays:
             self.arrays[array_name] = {'type': data_type, 'values': []}
         
-        # Ensure the array is large enough
-        while len(self.arrays[array_name]['values']) <= index:
-            self.arrays[array_name]['values'].append(None)
+        # Ensure the array is large enough (one bulk resize, not one append per slot)
+        arr = self.arrays[array_name]['values']
+        delta = index + 1 - len(arr)
+        if delta > 0:
+            arr.extend([None] * delta)
         
         # Set the value at the specified index
-        self.arrays[array_name]['values'][index] = converted_value
+        arr[index] = converted_value
         
         # Could trigger updates for specific array elements
         self.update_array_element_display(array_name, index, converted_value)
@@ -299,11 +333,13 @@ class ArduinoMessageHandler:
         """
         Convert string values to appropriate types based on data_type
         """
-        if data_type.lower() == 'float':
-            return [float(v) for v in values]
-        elif data_type.lower() == 'int':
-            return [int(v) for v in values]
-        elif data_type.lower() == 'bool':
+        kind = data_type.lower()
+        # map() runs the numeric conversion in C rather than a Python-level loop
+        if kind == 'float':
+            return list(map(float, values))
+        elif kind == 'int':
+            return list(map(int, values))
+        elif kind == 'bool':
             return [v.lower() == 'true' for v in values]
         else:  # Default to string
             return values
@@ -474,6 +510,7 @@ def demo_message_handling():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     demo_message_handling()
     
     print("\n" + "=" * 50)
@@ -0,0 +1,103 @@
+import json
+import os
+import re
+
+# Fields shared by every command entry; copied per entry by parse_cmd_file
+_COMMAND_TEMPLATE = {
+    "name": "",
+    "type": "command",
+    "description": "",
+    "units": "",
+    "writable": False,
+}
+
+# Compiled pattern per prefixes tuple
+_PATTERNS = {}
+
+# Raw database file contents per path, as (st_mtime_ns, bytes)
+_DB_CACHE = {}
+
+
+def load_db(path):
+    """Load the JSON database at ``path``, reusing an earlier read in this process.
+
+    The file's bytes are cached while its mtime is unchanged, and each call
+    parses them afresh, so callers get their own data and are free to modify it.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _DB_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        raw = cached[1]
+    else:
+        with open(path, "rb") as f:
+            raw = f.read()
+        _DB_CACHE[path] = (mtime_ns, raw)
+    return json.loads(raw)
+
+
+def save_db(path, data):
+    """Write ``data`` as the JSON database at ``path``.
+
+    The JSON goes to a temp file that replaces ``path`` only once complete, so
+    a failed write never truncates the database; the temp file is removed.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        # json.dump streams the encoder's small chunks; a 1 MB buffer turns
+        # them into a few large writes
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _command_pattern(prefixes):
+    """Build (and cache) the bytes line pattern for the given accepted prefixes.
+
+    A line is a command when it starts with one of the prefixes. The '1-'
+    version marker is dropped from the name, which runs up to the first
+    space; the rest of the line is the description. Table rows (containing
+    '|') never match.
+    """
+    pattern = _PATTERNS.get(prefixes)
+    if pattern is None:
+        starts = b"|".join(re.escape(p.encode("utf-8")) for p in prefixes)
+        pattern = re.compile(
+            rb"^[ \t]*(?=" + starts + rb")(?:1-)?[ \t]*([^ \r\n|]+)[ \t]*([^\r\n|]*?)[ \t\r]*$",
+            re.M,
+        )
+        _PATTERNS[prefixes] = pattern
+    return pattern
+
+
+def parse_cmd_file(path, data, *, prefixes=("1-sim/",)):
+    """Parse a command list file against an existing database.
+
+    Returns (new_entries, matched): entries for command names not already in
+    ``data`` (in file order), and the number of command lines found including
+    those already present. ``data`` itself is not modified.
+    """
+    # Matched on raw bytes; only the name/description kept are decoded
+    with open(path, "rb") as f:
+        buf = f.read()
+
+    new_entries = {}
+    matched = 0
+    contains = data.__contains__
+    for match in _command_pattern(tuple(prefixes)).finditer(buf):
+        matched += 1
+        name = match.group(1).decode("utf-8")
+        if contains(name) or name in new_entries:
+            continue
+
+        entry = _COMMAND_TEMPLATE.copy()
+        entry["name"] = name
+        entry["description"] = match.group(2).decode("utf-8") or "Command"
+        new_entries[name] = entry
+
+    return new_entries, matched
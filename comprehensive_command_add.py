@@ -1,5 +1,7 @@
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from command_file_parser import load_db, parse_cmd_file, save_db
 
 
 def comprehensive_command_add():
@@ -7,10 +9,12 @@ def comprehensive_command_add():
 
     # Load current database
     db_path = "resources/dataref_database.json"
-    with open(db_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_db(db_path)
 
     current_commands = sum(1 for v in data.values() if v.get("type") == "command")
+    # Only command entries are ever inserted, so growth in len(data) is the
+    # number of commands added; no rescan needed for the final count
+    initial_total = len(data)
     print(f"Current database has {current_commands} commands")
 
     # Process all command files
@@ -21,59 +25,30 @@ def comprehensive_command_add():
 
     total_added = 0
 
+    # Parse all files concurrently against the loaded database, then merge the
+    # results in list order below. Accept "sim/..." lines with or without the
+    # '1-' prefix.
+    present = [p for p in command_files if os.path.exists(p)]
+    with ThreadPoolExecutor(max_workers=max(len(present), 1)) as ex:
+        futures = {
+            p: ex.submit(parse_cmd_file, p, data, prefixes=("1-sim/", "sim/"))
+            for p in present
+        }
+
     for file_path in command_files:
-        if not os.path.exists(file_path):
+        if file_path not in futures:
             print(f"Skipping {file_path} - file not found")
             continue
 
         print(f"Processing {file_path}...")
-        added = 0
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-
-                    # Skip empty lines, headers, lines with pipes, digit-only lines
-                    if (
-                        not line
-                        or line.startswith("#")
-                        or "|" in line
-                        or line.isdigit()
-                    ):
-                        continue
-
-                    # Determine command name based on format
-                    if line.startswith("1-sim/"):
-                        cmd_line = line[2:].strip()  # Remove '1-' prefix
-                    elif line.startswith("sim/") or line.startswith("1-sim/"):
-                        cmd_line = line.strip()
-                    else:
-                        continue
-
-                    # Find first space to separate name from description
-                    if " " in cmd_line:
-                        first_space = cmd_line.find(" ")
-                        name = cmd_line[:first_space].strip()
-                        description = cmd_line[first_space:].strip()
-                    else:
-                        name = cmd_line
-                        description = "Command"
-
-                    # Add to database if not already present
-                    if name not in data:
-                        data[name] = {
-                            "name": name,
-                            "type": "command",
-                            "description": description,
-                            "units": "",
-                            "writable": False,
-                        }
-                        added += 1
-                        if added <= 10:  # Show first 10 additions per file
-                            print(f"  Added: {name}")
-                    else:
-                        added += 1
+            new_entries, added = futures[file_path].result()
+            # Drop names an earlier file already added
+            new_entries = {k: v for k, v in new_entries.items() if k not in data}
+            for name in list(new_entries)[:10]:  # Show first 10 additions per file
+                print(f"  Added: {name}")
+            data.update(new_entries)
 
             print(f"Added {added} commands from {file_path}")
             total_added += added
@@ -85,17 +60,13 @@ def comprehensive_command_add():
     print("Saving updated database...")
 
     # Save updated database
-    with open(db_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    save_db(db_path, data)
 
     print("Database updated successfully!")
 
-    # Final verification
-    with open(db_path, "r", encoding="utf-8") as f:
-        updated_data = json.load(f)
-
-    final_commands = sum(1 for v in updated_data.values() if v.get("type") == "command")
-    final_total = len(updated_data)
+    # Final verification (in-memory data is what was just written)
+    final_total = len(data)
+    final_commands = current_commands + (final_total - initial_total)
 
     print(f"\\n=== FINAL COMPREHENSIVE VERIFICATION ===")
     print(f"Total entries: {final_total}")
@@ -117,9 +88,9 @@ def comprehensive_command_add():
     print("\\n=== CHECKING FOR SPECIFIC COMMANDS ===")
     found_count = 0
     for cmd in target_commands:
-        if cmd in updated_data:
+        if cmd in data:
             found_count += 1
-            entry = updated_data[cmd]
+            entry = data[cmd]
             print(f"✅ FOUND: {cmd}")
             print(f"   Description: {entry.get('description', 'N/A')}")
         else:
@@ -131,26 +102,19 @@ def comprehensive_command_add():
 
     # Show command categories
     print("\\n=== COMMAND CATEGORIES ===")
-    sim_1 = sum(
-        1
-        for k in updated_data.keys()
-        if k.startswith("1-sim/") and updated_data[k].get("type") == "command"
-    )
-    sim_operation = sum(
-        1
-        for k in updated_data.keys()
-        if k.startswith("sim/operation/") and updated_data[k].get("type") == "command"
-    )
-    sim_comm = sum(
-        1
-        for k in updated_data.keys()
-        if k.startswith("sim/comm/") and updated_data[k].get("type") == "command"
-    )
-    sim_command = sum(
-        1
-        for k in updated_data.keys()
-        if k.startswith("sim/command/") and updated_data[k].get("type") == "command"
-    )
+    # One pass over the database, bucketing each command by prefix
+    sim_1 = sim_operation = sim_comm = sim_command = 0
+    for k, v in data.items():
+        if v.get("type") != "command":
+            continue
+        if k.startswith("1-sim/"):
+            sim_1 += 1
+        elif k.startswith("sim/operation/"):
+            sim_operation += 1
+        elif k.startswith("sim/comm/"):
+            sim_comm += 1
+        elif k.startswith("sim/command/"):
+            sim_command += 1
     other = final_commands - sim_1 - sim_operation - sim_comm - sim_command
 
     print(f"1-sim/ commands: {sim_1}")
@@ -1,14 +1,16 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Dict, Set
-import time
+from enum import IntEnum, auto
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Set
+import sys
+from time import monotonic as _now
 
 
 import threading
 
 
-class DeviceType(Enum):
+class DeviceType(IntEnum):
     UNKNOWN = auto()
     ARDUINO_NANO = auto()
     ARDUINO_PRO_MICRO = auto()
@@ -18,21 +20,46 @@ class DeviceType(Enum):
     ESP32S3 = auto()
 
 
-class DeviceState(Enum):
-    DISCONNECTED = auto()
-    CONNECTING = auto()
-    HANDSHAKE = auto()
-    READY = auto()
-    ACTIVE = auto()
-    ERROR = auto()
+class DeviceState(IntEnum):
+    # One bit per state so the state predicates are single mask tests
+    DISCONNECTED = 1
+    CONNECTING = 2
+    HANDSHAKE = 4
+    READY = 8
+    ACTIVE = 16
+    ERROR = 32
 
 
-@dataclass
+# Fixed membership sets for device state checks
+READY_STATES = frozenset({DeviceState.READY, DeviceState.ACTIVE})
+STOPPED_STATES = frozenset({DeviceState.DISCONNECTED, DeviceState.ERROR})
+
+_READY_MASK = DeviceState.READY | DeviceState.ACTIVE
+_CONNECTED_MASK = (
+    DeviceState.CONNECTING | DeviceState.HANDSHAKE | DeviceState.READY | DeviceState.ACTIVE
+)
+
+
+# Member -> name, so serialization skips the Enum .name descriptor
+_STATE_NAMES = {s: s.name for s in DeviceState}
+_TYPE_NAMES = {t: t.name for t in DeviceType}
+
+# Baud rate nearly every device runs at
+DEFAULT_BAUDRATE = 115200
+
+# Guards the lazy creation of per-device locks
+_LOCK_INIT = threading.Lock()
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(eq=False, repr=False, **_DATACLASS_SLOTS)
 class ArduinoDevice:
     """Represents a connected Arduino/ESP32 device."""
 
     port: str
-    baudrate: int = 115200
+    baudrate: int = DEFAULT_BAUDRATE
 
     state: DeviceState = DeviceState.DISCONNECTED
     device_type: DeviceType = DeviceType.UNKNOWN
@@ -41,53 +68,157 @@ class ArduinoDevice:
     board_type: str = ""
     device_name: str = ""
 
-    last_seen: float = field(default_factory=time.time)
+    # time.monotonic() timestamp; only meaningful relative to other readings
+    last_seen: float = field(default_factory=_now)
     error_message: str = ""
 
     # Subscriptions: dataref -> local key mapping
-    subscriptions: Dict[str, str] = field(default_factory=dict)
-
-    # Last received input values
-    _inputs: Dict[str, float] = field(default_factory=dict)
-    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    subscriptions: Dict[str, str] = field(default_factory=dict, repr=False)
+
+    # Last received input values. An existing key is overwritten in place,
+    # which never resizes the dict; only a new key rebinds _inputs to a grown
+    # copy, so the dict readers iterate never changes size underneath them.
+    _inputs: Dict[str, float] = field(default_factory=dict, repr=False)
+    # Read-only view of _inputs, rebuilt whenever _inputs is rebound
+    _inputs_view: Mapping[str, float] = field(init=False, repr=False)
+    # Reads and in-place overwrites are single dict operations, atomic under
+    # CPython's GIL, and take no lock. The lock only guards the copy-and-rebind
+    # for new keys, a read-modify-write that would otherwise lose a concurrent
+    # writer's key. A free-threaded build would need it on overwrites as well.
+    # Created on first use (see _writer_lock): many probed devices never
+    # receive an input.
+    _lock: threading.Lock | None = field(default=None, repr=False)
+
+    # Bumped on every change to_dict() reports; its cached result is reused
+    # while the version it was built at is still current
+    _version: int = field(default=0, repr=False)
+    _dict_cache: dict | None = field(default=None, repr=False)
+    _dict_version: int = field(default=-1, repr=False)
+    # to_dict() fields fixed by the handshake, built once the device is READY
+    _identity_dict: dict | None = field(default=None, repr=False)
+
+    # Received bytes after the last complete line, kept for the next read
+    _rx_buf: bytearray = field(default_factory=bytearray, repr=False)
+
+    # Called as on_ready_change(device, is_ready) when a transition flips is_ready
+    on_ready_change: Callable[[ArduinoDevice, bool], None] | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        self._inputs_view = MappingProxyType(self._inputs)
+
+    def __repr__(self) -> str:
+        # Identity only; subscriptions and inputs can be large
+        return (
+            f"ArduinoDevice(port={self.port!r}, state={_STATE_NAMES[self.state]}, "
+            f"type={_TYPE_NAMES[self.device_type]})"
+        )
+
+    def _writer_lock(self) -> threading.Lock:
+        lock = self._lock
+        if lock is None:
+            with _LOCK_INIT:
+                lock = self._lock
+                if lock is None:
+                    lock = self._lock = threading.Lock()
+        return lock
+
+    def subscribe(self, dataref: str, key: str) -> None:
+        """Map a dataref to the local key it is sent to the device as."""
+        self.subscriptions[sys.intern(dataref)] = sys.intern(key)
+        self._version += 1
+
+    def unsubscribe(self, dataref: str) -> None:
+        """Remove a dataref subscription, if present."""
+        if self.subscriptions.pop(dataref, None) is not None:
+            self._version += 1
 
     def set_input(self, key: str, value: float) -> None:
-        """Thread-safe method to set an input value."""
-        with self._lock:
-            self._inputs[key] = value
+        """Thread-safe method to set an input value.
+
+        Values are stored as float, so readers never need to convert them.
+        """
+        value = float(value)
+        inputs = self._inputs
+        if key in inputs:
+            inputs[key] = value
+        else:
+            with self._writer_lock():
+                if key in self._inputs:
+                    self._inputs[key] = value
+                else:
+                    inputs = {**self._inputs, sys.intern(key): value}
+                    self._inputs_view = MappingProxyType(inputs)
+                    self._inputs = inputs
+        # Bumped only once the value is stored, so to_dict() never caches the
+        # old inputs under the new version
+        self._version += 1
 
     def get_input(self, key: str) -> float | None:
         """Thread-safe method to get a single input value."""
-        with self._lock:
-            return self._inputs.get(key)
+        return self._inputs.get(key)
+
+    def get_all_inputs(self) -> Mapping[str, float]:
+        """Thread-safe method to get a read-only view of all input values.
 
-    def get_all_inputs(self) -> Dict[str, float]:
-        """Thread-safe method to get a copy of all input values."""
-        with self._lock:
-            return self._inputs.copy()
+        The view tracks updates to existing keys but not keys added later;
+        take dict(view) for a snapshot.
+        """
+        return self._inputs_view
 
-    def transition(self, new_state: DeviceState, error: str = "") -> None:
+    def transition(self, new_state: DeviceState, error: str = "",
+                   now: float | None = None) -> None:
+        """Move to ``new_state``.
+
+        ``now`` lets a caller handling many events share one clock reading;
+        it defaults to the current monotonic time.
+        """
+        was_ready = self.state & _READY_MASK
         self.state = new_state
-        self.last_seen = time.time()
+        self.last_seen = _now() if now is None else now
         self.error_message = error
+        if new_state == DeviceState.READY:
+            self._identity_dict = self._build_identity()
+        self._version += 1
+        callback = self.on_ready_change
+        if callback is not None and bool(was_ready) != bool(new_state & _READY_MASK):
+            callback(self, not was_ready)
+
+    def _build_identity(self) -> dict:
+        return {
+            "port": self.port,
+            "baudrate": self.baudrate,
+            "device_type": _TYPE_NAMES[self.device_type],
+            "firmware_version": self.firmware_version,
+            "board_type": self.board_type,
+            "device_name": self.device_name,
+        }
 
     @property
     def is_ready(self) -> bool:
-        return self.state in (DeviceState.READY, DeviceState.ACTIVE)
+        return bool(self.state & _READY_MASK)
 
     @property
     def is_connected(self) -> bool:
-        return self.state not in (DeviceState.DISCONNECTED, DeviceState.ERROR)
+        return bool(self.state & _CONNECTED_MASK)
 
     def to_dict(self) -> dict:
-        return {
-            "port": self.port,
-            "baudrate": self.baudrate,
-            "state": self.state.name,
-            "device_type": self.device_type.name,
-            "firmware_version": self.firmware_version,
-            "board_type": self.board_type,
-            "device_name": self.device_name,
+        """Serialize the device state.
+
+        The result is cached until the device next changes, so callers must
+        treat it as read-only.
+        """
+        version = self._version
+        if self._dict_cache is not None and self._dict_version == version:
+            return self._dict_cache
+
+        # Before READY the handshake may still be filling in the identity
+        identity = self._identity_dict or self._build_identity()
+        self._dict_cache = {
+            **identity,
+            "state": _STATE_NAMES[self.state],
             "subscriptions": dict(self.subscriptions),
-            "inputs": self.get_all_inputs(),
+            "inputs": dict(self._inputs),
         }
+        self._dict_version = version
+        return self._dict_cache
+
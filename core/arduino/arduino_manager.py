@@ -1,151 +1,246 @@
 from __future__ import annotations
 import asyncio
+import collections
+import functools
 import logging
 import re
+import sys
 import threading
 import time
-from typing import Dict, Callable, Optional, List, Any
+import traceback
+from typing import Dict, Callable, Optional, List, Any, Tuple, FrozenSet
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
-# Import serial with proper error handling for PyInstaller
-try:
-    import serial
-    import serial.tools.list_ports
-    import serial.serialwin32  # Explicitly import Windows backend for PyInstaller
-    import serial.serialutil   # Also import serialutil which contains Serial base class
-    import serial.win32       # Import Windows-specific constants
+from core.variable_store import VariableType
 
-    SERIAL_AVAILABLE = True
+# Import shared definitions
+from .arduino_device import (
+    DEFAULT_BAUDRATE, ArduinoDevice, DeviceState, DeviceType, READY_STATES,
+    STOPPED_STATES,
+)
 
-    # Define SerialException and Serial from the imported module
-    SerialException = getattr(serial, 'SerialException', Exception)
+log = logging.getLogger(__name__)
 
-    # Try multiple ways to get the Serial class in case of packaging issues
-    Serial = getattr(serial, 'Serial', None)
-    if Serial is None:
-        # If direct access fails, try importing directly
-        try:
-            from serial import Serial
-        except ImportError:
-            # Last resort: try to access from the serial module directly
-            Serial = None  # Reset to None if import failed
-            if hasattr(serial, 'serialwin32'):
-                # On Windows, try to use the Windows-specific implementation
-                try:
-                    Serial = serial.serialwin32.Serial
-                except (AttributeError, ImportError):
-                    Serial = None
-            # If serialwin32 doesn't have it, try other backends
-            if Serial is None:
-                try:
-                    from serial.serialposix import Serial  # For fallback
-                except ImportError:
-                    pass
 
-    if Serial is None:
-        # Create a mock Serial class if not available
-        class Serial:
-            def __init__(self, *args, **kwargs):
-                raise RuntimeError("pyserial Serial class not available")
-            def readline(self): return b""
-            def write(self, data): return len(data) if data else 0
-            @property
-            def in_waiting(self): return 0
-            def close(self): 
-                """Empty method for mock Serial class"""
-                pass
-            @property
-            def is_open(self): return False
+class _UnavailableSerial:
+    """Stand-in used when pyserial imports but its Serial class can't be found."""
+    def __init__(self, *args, **kwargs):
+        raise RuntimeError("pyserial Serial class not available")
+    def readline(self): return b""
+    def write(self, data): return len(data) if data else 0
+    @property
+    def in_waiting(self): return 0
+    def close(self): 
+        """Empty method for mock Serial class"""
+        pass
+    @property
+    def is_open(self): return False
+
+
+class _MockSerial:
+    """Stand-in that mimics the basic Serial interface when pyserial is missing."""
+    def __init__(self, *args, **kwargs):
+        # Store parameters but don't actually connect
+        self._port = args[0] if args else None
+        self._baudrate = args[1] if len(args) > 1 else kwargs.get('baudrate', 9600)
+        self._timeout = kwargs.get('timeout', 1.0)
+        self._write_timeout = kwargs.get('write_timeout', 1.0)
+        self._is_open = False
+    def readline(self):
+        return b""
+    def read(self, size=1):
+        time.sleep(self._timeout)
+        return b""
+    def write(self, data):
+        return len(data) if data else 0
+    @property
+    def in_waiting(self):
+        return 0
+    def close(self):
+        self._is_open = False
+    @property
+    def is_open(self):
+        return self._is_open
+
+
+# pyserial is imported on first use by _lazy_import_serial(); None until then
+_serial_mod = None
+_Serial_cls = None
+_SerialException = Exception
+_SERIAL_AVAILABLE: Optional[bool] = None
+_serial_import_lock = threading.Lock()
+
+
+def _lazy_import_serial() -> bool:
+    """Import pyserial on first call and return whether it is available.
+
+    The import cascade (and its PyInstaller fallbacks) is slow, so it is
+    deferred until serial access is actually needed.
+    """
+    global _serial_mod, _Serial_cls, _SerialException, _SERIAL_AVAILABLE
+    if _SERIAL_AVAILABLE is not None:
+        return _SERIAL_AVAILABLE
 
-    # Ensure critical constants exist in the serial module
-    if not hasattr(serial, 'FIVEBITS'):
-        try:
-            from serial import FIVEBITS, SIXBITS, SEVENBITS, EIGHTBITS
-            serial.FIVEBITS = FIVEBITS
-            serial.SIXBITS = SIXBITS
-            serial.SEVENBITS = SEVENBITS
-            serial.EIGHTBITS = EIGHTBITS
-        except ImportError:
-            # Define defaults if import fails
-            serial.FIVEBITS = 5
-            serial.SIXBITS = 6
-            serial.SEVENBITS = 7
-            serial.EIGHTBITS = 8
-
-    if not hasattr(serial, 'STOPBITS_ONE'):
-        try:
-            from serial import STOPBITS_ONE, STOPBITS_ONE_POINT_FIVE, STOPBITS_TWO
-            serial.STOPBITS_ONE = STOPBITS_ONE
-            serial.STOPBITS_ONE_POINT_FIVE = STOPBITS_ONE_POINT_FIVE
-            serial.STOPBITS_TWO = STOPBITS_TWO
-        except ImportError:
-            # Define defaults if import fails
-            serial.STOPBITS_ONE = 1
-            serial.STOPBITS_ONE_POINT_FIVE = 1.5
-            serial.STOPBITS_TWO = 2
-
-    if not hasattr(serial, 'PARITY_NONE'):
+    with _serial_import_lock:
+        if _SERIAL_AVAILABLE is not None:
+            return _SERIAL_AVAILABLE
+
+        # Import serial with proper error handling for PyInstaller
         try:
-            from serial import PARITY_NONE, PARITY_EVEN, PARITY_ODD, PARITY_MARK, PARITY_SPACE
-            serial.PARITY_NONE = PARITY_NONE
-            serial.PARITY_EVEN = PARITY_EVEN
-            serial.PARITY_ODD = PARITY_ODD
-            serial.PARITY_MARK = PARITY_MARK
-            serial.PARITY_SPACE = PARITY_SPACE
-        except ImportError:
-            # Define defaults if import fails
-            serial.PARITY_NONE = 'N'
-            serial.PARITY_EVEN = 'E'
-            serial.PARITY_ODD = 'O'
-            serial.PARITY_MARK = 'M'
-            serial.PARITY_SPACE = 'S'
-
-    # Log the actual file path of the imported module for debugging
-    import logging
-    log = logging.getLogger(__name__)
-    log.info("pyserial imported successfully from: %s", getattr(serial, '__file__', 'None'))
-    log.info("Serial class available: %s", Serial is not None and Serial.__name__)
-    log.info("SerialBase available: %s", hasattr(serial, 'SerialBase'))
-    log.info("FIVEBITS available: %s", hasattr(serial, 'FIVEBITS'))
-    log.info("STOPBITS_ONE available: %s", hasattr(serial, 'STOPBITS_ONE'))
-    log.info("PARITY_NONE available: %s", hasattr(serial, 'PARITY_NONE'))
-
-except ImportError as e:
-    SERIAL_AVAILABLE = False
-    # Log the import error for debugging
-    import logging
-    log = logging.getLogger(__name__)
-    log.warning("pyserial import failed: %s", e)
-
-    # Fallback to standard exceptions if all serial imports fail
-    SerialException = Exception  # Use standard exception
-    # Create a mock Serial class that mimics the basic interface
-    class Serial:
-        def __init__(self, *args, **kwargs):
-            # Store parameters but don't actually connect
-            self._port = args[0] if args else None
-            self._baudrate = args[1] if len(args) > 1 else kwargs.get('baudrate', 9600)
-            self._timeout = kwargs.get('timeout', 1.0)
-            self._write_timeout = kwargs.get('write_timeout', 1.0)
-            self._is_open = False
-        def readline(self):
-            return b""
-        def write(self, data):
-            return len(data) if data else 0
-        @property
-        def in_waiting(self):
-            return 0
-        def close(self):
-            self._is_open = False
-        @property
-        def is_open(self):
-            return self._is_open
+            import serial
+            import serial.tools.list_ports
+            import serial.serialwin32  # Explicitly import Windows backend for PyInstaller
+            import serial.serialutil   # Also import serialutil which contains Serial base class
+            import serial.win32       # Import Windows-specific constants
+        except ImportError as e:
+            # Log the import error for debugging
+            log.warning("pyserial import failed: %s", e)
+            # Fallback to standard exceptions if all serial imports fail
+            _SerialException = Exception
+            _Serial_cls = _MockSerial
+            _SERIAL_AVAILABLE = False
+            return False
 
-# Import shared definitions
-from .arduino_device import ArduinoDevice, DeviceState, DeviceType
+        # Define SerialException and Serial from the imported module
+        _SerialException = getattr(serial, 'SerialException', Exception)
 
-log = logging.getLogger(__name__)
+        # Try multiple ways to get the Serial class in case of packaging issues
+        Serial = getattr(serial, 'Serial', None)
+        if Serial is None:
+            # If direct access fails, try importing directly
+            try:
+                from serial import Serial
+            except ImportError:
+                # Last resort: try to access from the serial module directly
+                Serial = None  # Reset to None if import failed
+                if hasattr(serial, 'serialwin32'):
+                    # On Windows, try to use the Windows-specific implementation
+                    try:
+                        Serial = serial.serialwin32.Serial
+                    except (AttributeError, ImportError):
+                        Serial = None
+                # If serialwin32 doesn't have it, try other backends
+                if Serial is None:
+                    try:
+                        from serial.serialposix import Serial  # For fallback
+                    except ImportError:
+                        pass
+
+        if Serial is None:
+            Serial = _UnavailableSerial
+
+        # Ensure critical constants exist in the serial module
+        if not hasattr(serial, 'FIVEBITS'):
+            try:
+                from serial import FIVEBITS, SIXBITS, SEVENBITS, EIGHTBITS
+                serial.FIVEBITS = FIVEBITS
+                serial.SIXBITS = SIXBITS
+                serial.SEVENBITS = SEVENBITS
+                serial.EIGHTBITS = EIGHTBITS
+            except ImportError:
+                # Define defaults if import fails
+                serial.FIVEBITS = 5
+                serial.SIXBITS = 6
+                serial.SEVENBITS = 7
+                serial.EIGHTBITS = 8
+
+        if not hasattr(serial, 'STOPBITS_ONE'):
+            try:
+                from serial import STOPBITS_ONE, STOPBITS_ONE_POINT_FIVE, STOPBITS_TWO
+                serial.STOPBITS_ONE = STOPBITS_ONE
+                serial.STOPBITS_ONE_POINT_FIVE = STOPBITS_ONE_POINT_FIVE
+                serial.STOPBITS_TWO = STOPBITS_TWO
+            except ImportError:
+                # Define defaults if import fails
+                serial.STOPBITS_ONE = 1
+                serial.STOPBITS_ONE_POINT_FIVE = 1.5
+                serial.STOPBITS_TWO = 2
+
+        if not hasattr(serial, 'PARITY_NONE'):
+            try:
+                from serial import PARITY_NONE, PARITY_EVEN, PARITY_ODD, PARITY_MARK, PARITY_SPACE
+                serial.PARITY_NONE = PARITY_NONE
+                serial.PARITY_EVEN = PARITY_EVEN
+                serial.PARITY_ODD = PARITY_ODD
+                serial.PARITY_MARK = PARITY_MARK
+                serial.PARITY_SPACE = PARITY_SPACE
+            except ImportError:
+                # Define defaults if import fails
+                serial.PARITY_NONE = 'N'
+                serial.PARITY_EVEN = 'E'
+                serial.PARITY_ODD = 'O'
+                serial.PARITY_MARK = 'M'
+                serial.PARITY_SPACE = 'S'
+
+        # Log the actual file path of the imported module for debugging
+        log.info("pyserial imported successfully from: %s", getattr(serial, '__file__', 'None'))
+        log.info("Serial class available: %s", Serial is not None and Serial.__name__)
+        log.info("SerialBase available: %s", hasattr(serial, 'SerialBase'))
+        log.info("FIVEBITS available: %s", hasattr(serial, 'FIVEBITS'))
+        log.info("STOPBITS_ONE available: %s", hasattr(serial, 'STOPBITS_ONE'))
+        log.info("PARITY_NONE available: %s", hasattr(serial, 'PARITY_NONE'))
+
+        _serial_mod = serial
+        _Serial_cls = Serial
+        _SERIAL_AVAILABLE = True
+        return True
+
+
+def __getattr__(name: str):
+    # Keep the old module-level names working; reading them triggers the import
+    if name == "SERIAL_AVAILABLE":
+        return _lazy_import_serial()
+    if name == "serial":
+        _lazy_import_serial()
+        return _serial_mod
+    if name == "Serial":
+        _lazy_import_serial()
+        return _Serial_cls
+    if name == "SerialException":
+        _lazy_import_serial()
+        return _SerialException
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_ARRAY_SIZE_RE = re.compile(r'\[(\d+)\]')
+
+# First characters float() can accept ("nan"/"inf" included); anything else
+# is a string value and skips the raise-and-catch in _handle_input
+_NUMERIC_LEAD = frozenset("+-.0123456789nNiI")
+
+# A complete handshake line, e.g. b"XPDR;fw=1.0;board=ESP32S2;name=FGCP\r\n"
+_HANDSHAKE_RE = re.compile(rb'XPDR[^\r\n]*\r?\n')
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_dataref_type(dataref_type: str) -> Tuple[str, Optional[int]]:
+    """Classify a dataref type string as (kind, size).
+
+    kind is "command", "array", "string" or "scalar"; size is the bracketed
+    length if the type has one. Dataref types come from a small set, so the
+    result is cached.
+    """
+    match = _ARRAY_SIZE_RE.search(dataref_type)
+    size = int(match.group(1)) if match else None
+    if dataref_type == "command":
+        return "command", size
+    if "[" in dataref_type:
+        return "array", size
+    if "string" in dataref_type or "byte" in dataref_type:
+        return "string", size
+    return "scalar", size
+
+
+def _quantize(value) -> Any:
+    """Return the last-sent comparison key for a value: its 4-decimal int.
+
+    Matches the %.4f line format. Values that can't be scaled (strings,
+    nan/inf) compare by their text instead.
+    """
+    try:
+        return round(value * 10000.0)
+    except (TypeError, ValueError, OverflowError):
+        return str(value)
 
 
 class ArduinoManager:
@@ -157,17 +252,37 @@ class ArduinoManager:
     # Known ESP32 USB VID/PIDs
     ESP32_VIDS = {0x303A, 0x1A86, 0x10C4}
 
+    # Port enumeration cache shared by all managers:
+    # (monotonic time, comports() result, {fields: list_ports() dicts})
+    _PORTS_CACHE_TTL = 2.0
+    _ports_cache: Optional[Tuple[float, List[Any], Dict[Optional[FrozenSet[str]], List[Dict]]]] = None
+
     def __init__(self, variable_store=None, dataref_manager=None, xplane_conn=None) -> None:
         self._devices: Dict[str, ArduinoDevice] = {}
-        self._serials: Dict[str, Serial] = {}
+        # Shared copy of _devices handed out by devices_snapshot(); rebuilt
+        # only after _devices changes
+        self._devices_view: Optional[Dict[str, ArduinoDevice]] = None
+        self._serials: Dict[str, Any] = {}
         self._threads: Dict[str, threading.Thread] = {}
         self._lock = threading.Lock()
+        # Reverse index of device subscriptions: dataref -> [(port, key)].
+        # Lists are replaced, never mutated, so a snapshot stays valid.
+        self._subscribers: Dict[str, List[Tuple[str, str]]] = {}
+        # Ports whose current device is READY/ACTIVE, kept by _on_device_ready_change
+        self._ready_ports: set[str] = set()
 
-        # Cache for last sent values to avoid spam
-        self._last_sent: Dict[str, Dict[str, float]] = {}
+        # Last sent value per (port, key), quantized to the wire's 4 decimals, to avoid spam
+        self._last_sent: Dict[Tuple[str, str], Any] = {}
 
         # Universal Mappings: output_key -> {'source': source, 'is_variable': bool}
         self._universal_mappings: Dict[str, Dict[str, any]] = {}
+        # Reverse index: source -> first key (in mapping order) mapped to it
+        self._source_to_key: Dict[str, str] = {}
+        # Datarefs/variables some device or universal mapping cares about;
+        # on_dataref_update ignores everything else without taking the lock
+        self._active_datarefs: set[str] = set()
+        # Encoded b"SET <key> " per output key
+        self._key_prefix: Dict[str, bytes] = {}
         
         # Monitored Datarefs: Set of datarefs being watched (even if no key is mapped)
         self._monitored_datarefs: set[str] = set()
@@ -181,8 +296,40 @@ class ArduinoManager:
         # X-Plane connection for writing datarefs
         self.xplane_conn = xplane_conn
 
-        # Store tasks to prevent garbage collection
-        self._tasks: List[asyncio.Task] = []
+        # Pending tasks, held so they are not garbage collected; each one
+        # removes itself when done. A dict, used as an insertion-ordered set,
+        # so the oldest can be found when the cap is hit.
+        self._tasks: Dict[asyncio.Task, None] = {}
+
+        # Event loop thread for coroutines submitted from threads without a
+        # running loop (device threads); started on first use
+        self._bg_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Per-thread running loop (or None), probed once by _schedule()
+        self._thread_local = threading.local()
+        # Coroutines from loop-less threads, run in order by _drain_xp_queue()
+        # on the background loop; one wakeup covers everything queued meanwhile
+        self._xp_queue: collections.deque = collections.deque()
+        self._xp_queue_lock = threading.Lock()
+        self._xp_drain_pending = False
+        # Dataref writes forwarded from device INPUTs, coalesced to the newest
+        # value per dataref: dataref -> (is_string, value). See _queue_write().
+        self._pending_writes: Dict[str, Tuple[bool, Any]] = {}
+        self._pending_writes_lock = threading.Lock()
+        self._writes_flush_pending = False
+        self._writes_flushed_at = 0.0
+        # Device-state notifications are coalesced; see _notify_update()
+        self._notify_lock = threading.Lock()
+        self._notify_pending = False
+
+        # Handlers for device messages other than INPUT, by leading tag
+        # Keyed by the raw tag bytes; lines are dispatched before decoding
+        self._dispatch: Dict[bytes, Callable[[ArduinoDevice, str], None]] = {
+            b"DREF": self._handle_dref,
+            b"STRING": self._handle_string,
+            b"CMD": self._handle_cmd,
+            b"ACK": self._handle_ack,
+            b"STATUS": self._handle_status,
+        }
 
         # Callbacks
         self.on_device_update: Optional[Callable[[Dict[str, ArduinoDevice]], None]] = None
@@ -191,7 +338,124 @@ class ArduinoManager:
         self.on_dataref_write: Optional[Callable[[str, float], None]] = None
         self.on_command_send: Optional[Callable[[str], None]] = None
 
-        log.info("ArduinoManager initialized (Serial available: %s)", SERIAL_AVAILABLE)
+        log.info("ArduinoManager initialized")
+
+    def _get_bg_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread if needed."""
+        with self._lock:
+            if self._bg_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="arduino-bg-loop",
+                                 daemon=True).start()
+                self._bg_loop = loop
+            return self._bg_loop
+
+    def _schedule(self, coro) -> bool:
+        """Run an X-Plane coroutine from any thread.
+
+        On a thread with a running event loop the coroutine becomes a task
+        there and True is returned; otherwise it goes to the background loop.
+        The probe for a running loop is done once per thread.
+        """
+        local = self._thread_local
+        loop = getattr(local, "loop", False)
+        if loop is False or (loop is not None and loop.is_closed()):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            # The main thread may just not have started its loop yet
+            if loop is not None or threading.current_thread() is not threading.main_thread():
+                local.loop = loop
+
+        if loop is not None:
+            tasks = self._tasks
+            if len(tasks) >= self._XP_QUEUE_MAX:
+                # X-Plane writes are stalled; cancel the oldest, as the queue does
+                oldest = next(iter(tasks))
+                del tasks[oldest]
+                oldest.cancel()
+                log.warning("Too many pending X-Plane writes, cancelled oldest")
+            task = loop.create_task(coro)
+            tasks[task] = None
+            task.add_done_callback(self._forget_task)
+            return True
+
+        queue = self._xp_queue
+        if len(queue) >= self._XP_QUEUE_MAX:
+            # X-Plane writes are falling behind; drop the oldest
+            try:
+                queue.popleft().close()
+                log.warning("X-Plane write queue full, dropped oldest write")
+            except IndexError:
+                pass
+        queue.append(coro)
+        with self._xp_queue_lock:
+            if self._xp_drain_pending:
+                return False
+            self._xp_drain_pending = True
+        asyncio.run_coroutine_threadsafe(self._drain_xp_queue(), self._get_bg_loop())
+        return False
+
+    def _forget_task(self, task: asyncio.Task) -> None:
+        """Done callback for tasks created by _schedule()."""
+        self._tasks.pop(task, None)
+
+    # Shortest gap between two flushes of coalesced device writes (60 Hz)
+    _WRITE_INTERVAL = 1.0 / 60.0
+
+    def _queue_write(self, dataref: str, value, is_string: bool = False) -> None:
+        """Queue the X-Plane write for a mapped device INPUT.
+
+        Devices can report a value (e.g. a potentiometer) far faster than
+        X-Plane needs it, so writes are coalesced: only the newest value per
+        dataref is sent, in flushes at most _WRITE_INTERVAL apart. DREF and
+        STRING messages are explicit writes and do not come through here.
+        """
+        with self._pending_writes_lock:
+            self._pending_writes[dataref] = (is_string, value)
+            if self._writes_flush_pending:
+                return
+            self._writes_flush_pending = True
+        asyncio.run_coroutine_threadsafe(self._flush_pending_writes(), self._get_bg_loop())
+
+    async def _flush_pending_writes(self) -> None:
+        """Send the coalesced device writes (runs on the background loop)."""
+        delay = self._writes_flushed_at + self._WRITE_INTERVAL - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        with self._pending_writes_lock:
+            writes = self._pending_writes
+            self._pending_writes = {}
+            self._writes_flush_pending = False
+        self._writes_flushed_at = time.monotonic()
+
+        for dataref, (is_string, value) in writes.items():
+            try:
+                if is_string:
+                    await self.xplane_conn.write_dataref_string(dataref, value)
+                else:
+                    await self.xplane_conn.write_dataref(dataref, value)
+            except Exception as e:
+                log.error("Failed to write %s to X-Plane: %s", dataref, e)
+
+    # Most writes queued for the background loop before the oldest are dropped
+    _XP_QUEUE_MAX = 1024
+
+    async def _drain_xp_queue(self) -> None:
+        """Run queued X-Plane coroutines in order until the queue is empty."""
+        queue = self._xp_queue
+        while True:
+            with self._xp_queue_lock:
+                if not queue:
+                    self._xp_drain_pending = False
+                    return
+            try:
+                await queue.popleft()
+            except IndexError:
+                continue  # Taken by an overflow drop
+            except Exception as e:
+                log.error("X-Plane write failed: %s", e)
 
     # ============================================================
     # Universal Mapping API
@@ -207,9 +471,15 @@ class ArduinoManager:
             return
 
         if not key:
-            if key in self._universal_mappings:
-                del self._universal_mappings[key]
-                log.info("Removed mapping for %s", key)
+            # An empty key removes whatever keys the source is mapped to
+            removed = [k for k, info in self._universal_mappings.items() if info['source'] == source]
+            for k in removed:
+                del self._universal_mappings[k]
+                log.info("Removed mapping for %s", k)
+            if removed:
+                self._rebuild_source_index()
+                with self._lock:
+                    self._rebuild_active_datarefs()
         else:
             # Normalize key to uppercase
             key = key.upper()
@@ -219,20 +489,53 @@ class ArduinoManager:
                 log.warning(f"Key '{key}' re-mapped from '{self._universal_mappings[key]['source']}' to '{source}'")
 
             # Store the mapping with the 'is_variable' flag
+            previous = self._universal_mappings.get(key)
             self._universal_mappings[key] = {
                 'source': source,
                 'is_variable': is_variable
             }
+            if previous is None:
+                # A new key is last in mapping order
+                self._source_to_key.setdefault(source, key)
+                self._active_datarefs.add(source)
+            elif previous['source'] != source:
+                self._rebuild_source_index()
+                with self._lock:
+                    self._rebuild_active_datarefs()
+            self._set_prefix(key)
             if not is_variable:
                 self.add_monitor(source)  # Implicitly monitor datarefs, but not variables
             log.info(f"Mapped {source} -> {key} (Universal)" + (" (Variable)" if is_variable else ""))
 
     def get_universal_key(self, source: str) -> Optional[str]:
         """Get the key mapped to a source (dataref or variable)."""
+        return self._source_to_key.get(source)
+
+    def _rebuild_source_index(self) -> None:
+        """Recompute _source_to_key after a key was removed or re-pointed."""
+        index: Dict[str, str] = {}
         for key, info in self._universal_mappings.items():
-            if info['source'] == source:
-                return key
-        return None
+            index.setdefault(info['source'], key)
+        self._source_to_key = index
+
+    def _rebuild_active_datarefs(self) -> None:
+        """Recompute _active_datarefs from mappings and device subscriptions.
+
+        Caller must hold self._lock.
+        """
+        active = set(self._source_to_key)
+        active.update(self._subscribers)
+        self._active_datarefs = active
+
+    def _drop_port_subscribers(self, port: str) -> None:
+        """Remove a port's entries from _subscribers. Caller must hold self._lock."""
+        subscribers = {}
+        for dataref, subs in self._subscribers.items():
+            kept = [sub for sub in subs if sub[0] != port]
+            if kept:
+                subscribers[dataref] = kept
+        self._subscribers = subscribers
+        self._rebuild_active_datarefs()
 
     def get_all_universal_mappings(self) -> Dict[str, Dict[str, any]]:
         """Get copy of all universal mappings."""
@@ -246,6 +549,9 @@ class ArduinoManager:
     def clear_universal_mappings(self) -> None:
         """Clear all universal mappings."""
         self._universal_mappings.clear()
+        self._source_to_key.clear()
+        with self._lock:
+            self._rebuild_active_datarefs()
         self._monitored_datarefs.clear() # Clear monitors too as they are usually tied to UI rows
 
     # ============================================================
@@ -267,61 +573,159 @@ class ArduinoManager:
         """Get list of all monitored datarefs."""
         return list(self._monitored_datarefs)
 
-    def _send_if_changed(self, port: str, key: str, value: float) -> None:
-        """Send value only if it changed significantly."""
-        # Initialize cache
-        if port not in self._last_sent:
-            self._last_sent[port] = {}
+    # Queued bytes for one port are written early once they reach this size
+    _FLUSH_THRESHOLD = 512
 
-        cache_key = key
-        last_value = self._last_sent[port].get(cache_key)
+    def _send_if_changed(self, port: str, key: str, value: float,
+                         pending: Optional[Dict[str, bytearray]] = None,
+                         quantized: Any = None, line: Optional[bytes] = None) -> None:
+        """Send value only if it changed at the 4 decimals sent on the wire.
+
+        With ``pending``, the line is queued per port instead of written; the
+        caller writes each port's queue at once with _flush_writes().
+        Broadcasting callers pass ``quantized`` (from _quantize) and, when the
+        key is the same for every port, the encoded ``line``, computed once.
+        """
+        cache_key = (port, key)
+        if quantized is None:
+            quantized = _quantize(value)
+
+        if self._last_sent.get(cache_key) != quantized:
+            if pending is not None:
+                buf = pending.setdefault(port, bytearray())
+                buf += line if line is not None else self._format_value_line(key, value)
+                # Recorded now; _flush_writes forgets the port's values if the write fails
+                self._last_sent[cache_key] = quantized
+                log.debug("Queued for %s: %s = %.4f", port, key, value)
+                if len(buf) >= self._FLUSH_THRESHOLD:
+                    self._flush_writes({port: pending.pop(port)})
+                return
 
-        # Threshold for float comparison
-        if last_value is None or abs(value - last_value) > 0.001:
             success = self.send_value(port, key, value)
             if success:
-                self._last_sent[port][cache_key] = value
+                self._last_sent[cache_key] = quantized
                 log.debug("Sent to %s: %s = %.4f", port, key, value)
             else:
                 log.warning("Failed to send to %s: %s = %.4f", port, key, value)
 
-    @staticmethod
-    def list_ports() -> List[Dict]:
-        """Return list of available serial ports with device info."""
-        if not SERIAL_AVAILABLE:
+    def _flush_writes(self, pending: Dict[str, bytearray]) -> None:
+        """Write each port's queued lines with a single write."""
+        # Look up every port under one lock hold; the writes happen outside it
+        with self._lock:
+            targets = [(port, buf, self._serials.get(port), self._devices.get(port))
+                       for port, buf in pending.items() if buf]
+
+        for port, buf, ser, device in targets:
+            try:
+                if not ser or not device or not device.is_ready:
+                    raise RuntimeError("device not ready")
+                # pyserial takes the bytearray as is; no bytes() copy of our own
+                ser.write(buf)
+                log.debug("Sent %d bytes to %s", len(buf), port)
+            except Exception as e:
+                log.warning("Failed to send to %s: %s", port, e)
+                # Nothing queued reached the device; resend everything next time
+                self._forget_sent(port)
+        pending.clear()
+
+    def _forget_sent(self, port: str) -> None:
+        """Drop the port's last-sent values so every key is sent again.
+
+        _last_sent is written by _send_if_changed without a lock, from the GUI
+        thread and the background loop alike. The keys are snapshotted with
+        list(), which copies the dict in one step, and the port's entries are
+        popped in place, so a concurrent insert neither breaks the scan nor
+        lands in a dict that is about to be replaced.
+        """
+        last_sent = self._last_sent
+        for cache_key in list(last_sent):
+            if cache_key[0] == port:
+                last_sent.pop(cache_key, None)
+
+    def _set_prefix(self, key: str) -> bytes:
+        """Return the encoded b"SET <key> " line prefix, caching it."""
+        prefix = self._key_prefix.get(key)
+        if prefix is None:
+            prefix = self._key_prefix[key] = b"SET " + key.encode() + b" "
+        return prefix
+
+    def _format_value_line(self, key: str, value) -> bytes:
+        """Encode the device line for a value: STRING for text, SET otherwise."""
+        if isinstance(value, str):
+            return f"STRING {key} {value}\n".encode()
+        return self._set_prefix(key) + b"%.4f\n" % float(value)
+
+    @classmethod
+    def list_ports(cls, fields: Optional[FrozenSet[str]] = None) -> List[Dict]:
+        """Return list of available serial ports with device info.
+
+        With ``fields``, each dict holds only those keys (e.g.
+        frozenset({"port", "is_esp32"})); the default is all of them.
+
+        Enumeration is slow on Windows/macOS and the GUI polls this, so the
+        scan is reused for _PORTS_CACHE_TTL seconds, with the dicts built
+        once per ``fields``. The dicts are shared between calls, so treat them
+        as read-only. Call invalidate_ports_cache() to force a fresh scan
+        (e.g. on hotplug).
+        """
+        if not _lazy_import_serial():
             log.warning("SERIAL_AVAILABLE is False - cannot list ports")
             return []
 
-        log.debug("Attempting to list serial ports...")
-        try:
-            ports = serial.tools.list_ports.comports()
+        now = time.monotonic()
+        cached = cls._ports_cache
+        if cached is None or now - cached[0] >= cls._PORTS_CACHE_TTL:
+            log.debug("Attempting to list serial ports...")
+            try:
+                ports = _serial_mod.tools.list_ports.comports()
+            except Exception as e:
+                log.error("Failed to list ports: %s", e)
+                return []
             log.info("Found %d serial port(s)", len(ports))
-            result = []
-
             for p in ports:
-                info = {
-                    "port": p.device,
-                    "description": p.description,
-                    "hwid": p.hwid,
-                    "vid": p.vid,
-                    "pid": p.pid,
-                    "serial_number": p.serial_number,
-                    "manufacturer": p.manufacturer,
-                    "product": p.product,
-                    "is_esp32": p.vid in ArduinoManager.ESP32_VIDS if p.vid else False,
-                }
                 log.debug("Port: %s - %s", p.device, p.description)
-                result.append(info)
+            cached = cls._ports_cache = (now, ports, {})
 
-            return result
-            
-        except Exception as e:
-            log.error("Failed to list ports: %s", e)
-            return []
+        views = cached[2]
+        result = views.get(fields)
+        if result is None:
+            try:
+                result = [cls._port_info(p, fields) for p in cached[1]]
+            except Exception as e:
+                log.error("Failed to list ports: %s", e)
+                return []
+            views[fields] = result
+        return list(result)
+
+    # list_ports() keys and the port attribute each comes from
+    _PORT_ATTRS = {
+        "port": "device",
+        "description": "description",
+        "hwid": "hwid",
+        "vid": "vid",
+        "pid": "pid",
+        "serial_number": "serial_number",
+        "manufacturer": "manufacturer",
+        "product": "product",
+    }
+
+    @classmethod
+    def _port_info(cls, p, fields: Optional[FrozenSet[str]]) -> Dict:
+        """Build the list_ports() dict for one port, limited to ``fields``."""
+        info = {name: getattr(p, attr) for name, attr in cls._PORT_ATTRS.items()
+                if fields is None or name in fields}
+        if fields is None or "is_esp32" in fields:
+            info["is_esp32"] = p.vid in cls.ESP32_VIDS if p.vid else False
+        return info
+
+    @classmethod
+    def invalidate_ports_cache(cls) -> None:
+        """Drop the cached port list so the next list_ports() rescans."""
+        cls._ports_cache = None
     
-    def connect(self, port: str, baudrate: int = 115200) -> bool:
+    def connect(self, port: str, baudrate: int = DEFAULT_BAUDRATE) -> bool:
         """Connect to a device on the specified port."""
-        if not SERIAL_AVAILABLE:
+        if not _lazy_import_serial():
             log.error("pyserial not available")
             return False
         
@@ -330,11 +734,22 @@ class ArduinoManager:
                 log.warning("Already connected to %s", port)
                 return False
             
+            # The new device starts without subscriptions or sent values
+            self._drop_port_subscribers(port)
+            self._forget_sent(port)
+
             device = ArduinoDevice(port=port, baudrate=baudrate)
+            device.on_ready_change = self._on_device_ready_change
             self._devices[port] = device
+            self._devices_view = None
         
-        # Start device thread
-        thread = threading.Thread(target=self._device_loop, args=(device,), daemon=True)
+        # Start device thread. Each device keeps its own blocking reader: pyserial
+        # has no selector support on Windows, so an asyncio transport would need
+        # pyserial-asyncio (not a dependency, and not in the frozen builds), and
+        # a selectors loop would only cover POSIX. Idle threads sleep in the
+        # driver's read, not in a poll loop.
+        thread = threading.Thread(target=self._device_loop, args=(device,),
+                                  name=f"arduino-{port}", daemon=True)
         self._threads[port] = thread
         thread.start()
         
@@ -346,6 +761,7 @@ class ArduinoManager:
             device = self._devices.get(port)
             if device:
                 device.transition(DeviceState.DISCONNECTED)
+            self._drop_port_subscribers(port)
             
             ser = self._serials.pop(port, None)
             if ser:
@@ -353,10 +769,31 @@ class ArduinoManager:
                     ser.close()
                 except Exception:
                     pass
+
+        # After the port is closed, so values recorded by a send that raced
+        # the disconnect are dropped as well; _last_sent is not under _lock
+        self._forget_sent(port)
         
         log.info("Disconnected from %s", port)
-        self._notify_update()
+        self._notify_update(urgent=True)
     
+    def _on_device_ready_change(self, device: ArduinoDevice, ready: bool) -> None:
+        """Track is_ready flips in _ready_ports.
+
+        Runs inside device.transition(), sometimes with self._lock held, so
+        it must not take the lock.
+        """
+        if self._devices.get(device.port) is not device:
+            return  # A replaced device finishing up
+        if ready:
+            self._ready_ports.add(device.port)
+        else:
+            self._ready_ports.discard(device.port)
+
+    def _ready_serial_ports(self) -> set:
+        """Ports that are ready and have an open serial. Caller holds self._lock."""
+        return self._ready_ports & self._serials.keys()
+
     def disconnect_all(self) -> None:
         """Disconnect from all devices."""
         ports = list(self._devices.keys())
@@ -364,35 +801,37 @@ class ArduinoManager:
             self.disconnect(port)
     
     def devices_snapshot(self) -> Dict[str, ArduinoDevice]:
-        """Get a snapshot of all devices."""
+        """Get a snapshot of all devices.
+
+        The same dict is returned until a device is added or replaced, so
+        callers must treat it as read-only.
+        """
         with self._lock:
-            return dict(self._devices)
+            view = self._devices_view
+            if view is None:
+                view = self._devices_view = dict(self._devices)
+            return view
     
     def get_device(self, port: str) -> Optional[ArduinoDevice]:
         """Get a specific device."""
-        with self._lock:
-            return self._devices.get(port)
+        # A single dict read is atomic; no need to queue behind writers
+        return self._devices.get(port)
     
     def send_value(self, port: str, key: str, value: float) -> bool:
         """Send a value to a device."""
-        with self._lock:
-            ser = self._serials.get(port)
-            device = self._devices.get(port)
+        # Lock-free lookups: a device disconnecting in between only makes the
+        # write below fail, which is handled
+        ser = self._serials.get(port)
+        device = self._devices.get(port)
         
         if not ser or not device or not device.is_ready:
             return False
         
         try:
-            # Handle different value types
-            if isinstance(value, str):
-                line = f"STRING {key} {value}\n"
-            else:
-                # Ensure numeric value
-                numeric_value = float(value)
-                line = f"SET {key} {numeric_value:.4f}\n"
-            
-            ser.write(line.encode())
-            log.debug("Sent to %s: %s", port, line.strip())
+            line = self._format_value_line(key, value)
+            ser.write(line)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Sent to %s: %s", port, line.decode().strip())
             return True
         except Exception as e:
             log.error("Failed to send to %s: %s", port, e)
@@ -400,9 +839,9 @@ class ArduinoManager:
     
     def send_command(self, port: str, command: str) -> bool:
         """Send a raw command to a device."""
-        with self._lock:
-            ser = self._serials.get(port)
-            device = self._devices.get(port)
+        # Lock-free lookups, as in send_value()
+        ser = self._serials.get(port)
+        device = self._devices.get(port)
 
         if not ser or not device or not device.is_ready:
             return False
@@ -422,30 +861,8 @@ class ArduinoManager:
         # Also forward to X-Plane if connection is available
         if self.xplane_conn:
             try:
-                import asyncio
-                try:
-                    # Check if we're in an event loop
-                    loop = asyncio.get_running_loop()
-                    # If we're in a loop, schedule the task
-                    task = loop.create_task(self.xplane_conn.write_dataref(dataref, value))
-                    self._tasks.append(task)  # Store task to prevent garbage collection
+                if self._schedule(self.xplane_conn.write_dataref(dataref, value)):
                     log.info("Scheduled DREF command to X-Plane: %s = %.4f", dataref, value)
-                except RuntimeError:
-                    # No event loop running, run in separate thread
-                    import threading
-                    def async_call():
-                        # Create a new event loop for this thread
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            coro = self.xplane_conn.write_dataref(dataref, value)
-                            new_loop.run_until_complete(coro)
-                        finally:
-                            new_loop.close()
-
-                    # Run in a separate thread
-                    thread = threading.Thread(target=async_call, daemon=True)
-                    thread.start()
             except Exception as e:
                 log.error("Failed to forward DREF to X-Plane: %s", e)
 
@@ -463,30 +880,8 @@ class ArduinoManager:
         # Also forward to X-Plane if connection is available
         if self.xplane_conn:
             try:
-                import asyncio
-                try:
-                    # Check if we're in an event loop
-                    loop = asyncio.get_running_loop()
-                    # If we're in a loop, schedule the task
-                    task = loop.create_task(self.xplane_conn.write_dataref_string(dataref, value))
-                    self._tasks.append(task)  # Store task to prevent garbage collection
+                if self._schedule(self.xplane_conn.write_dataref_string(dataref, value)):
                     log.info("Scheduled STRING command to X-Plane: %s = %s", dataref, value)
-                except RuntimeError:
-                    # No event loop running, run in separate thread
-                    import threading
-                    def async_call():
-                        # Create a new event loop for this thread
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            coro = self.xplane_conn.write_dataref_string(dataref, value)
-                            new_loop.run_until_complete(coro)
-                        finally:
-                            new_loop.close()
-
-                    # Run in a separate thread
-                    thread = threading.Thread(target=async_call, daemon=True)
-                    thread.start()
             except Exception as e:
                 log.error("Failed to forward STRING to X-Plane: %s", e)
 
@@ -500,7 +895,11 @@ class ArduinoManager:
         with self._lock:
             device = self._devices.get(port)
             if device:
-                device.subscriptions[dataref] = key
+                device.subscribe(dataref, key)
+                subs = [sub for sub in self._subscribers.get(dataref, ()) if sub[0] != port]
+                subs.append((port, device.subscriptions[dataref]))
+                self._subscribers[dataref] = subs
+                self._active_datarefs.add(dataref)
                 log.info("Device %s subscribed: %s -> %s", port, dataref, key)
                 return True
         return False
@@ -509,49 +908,59 @@ class ArduinoManager:
         """Unsubscribe a device from a dataref."""
         with self._lock:
             device = self._devices.get(port)
-            if device and dataref in device.subscriptions:
-                del device.subscriptions[dataref]
+            if device:
+                device.unsubscribe(dataref)
+                subs = [sub for sub in self._subscribers.get(dataref, ()) if sub[0] != port]
+                if subs:
+                    self._subscribers[dataref] = subs
+                else:
+                    self._subscribers.pop(dataref, None)
+                self._rebuild_active_datarefs()
     
     def on_dataref_update(self, dataref: str, value: float) -> None:
         """
         Called when a dataref value changes.
         Broadcasts to all devices if a universal mapping exists.
         """
-        # 1. Check for Universal Mapping
-        universal_key = None
-        for key, info in self._universal_mappings.items():
-            if info['source'] == dataref:
-                universal_key = key
-                break
-
-        log.debug("Checking universal mapping for %s: %s", dataref, universal_key)
-
-        if universal_key:
-            # Broadcast to ALL connected devices
-            with self._lock:
-                ports = [p for p, d in self._devices.items() if d.is_ready]
+        # Nothing maps or subscribes to it
+        if dataref not in self._active_datarefs:
+            return
 
-            log.debug("Broadcasting dataref %s = %.4f to %d devices with key %s",
-                     dataref, value, len(ports), universal_key)
+        # Lines for each port, written together at the end
+        pending: Dict[str, bytearray] = {}
 
-            for port in ports:
-                self._send_if_changed(port, universal_key, value)
+        # 1. Check for Universal Mapping
+        universal_key = self._source_to_key.get(dataref)
 
-        # 2. Check for Specific Subscriptions (Legacy/Direct mode)
-        # This preserves existing functionality for specific device subscriptions
+        # Under one lock: the universal key goes to ALL ready devices, then
+        # the dataref's subscribers (Legacy/Direct mode) unless their key is
+        # the same one that was just broadcast
         with self._lock:
-            devices_to_update = []
-            for port, device in self._devices.items():
-                if dataref in device.subscriptions and device.is_ready:
-                    key = device.subscriptions[dataref]
-                    # Avoid double sending if we just broadcasted the same key
-                    if key != universal_key:
-                        devices_to_update.append((port, key))
-
-        for port, key in devices_to_update:
-            log.debug("Sending dataref %s = %.4f to device %s with key %s",
-                     dataref, value, port, key)
-            self._send_if_changed(port, key, value)
+            ready = self._ready_serial_ports()
+            sends = [(port, universal_key) for port in ready] if universal_key else []
+            for port, key in self._subscribers.get(dataref, ()):
+                if key != universal_key and port in ready:
+                    sends.append((port, key))
+
+        # Same value for every target, so quantize it once, and encode each
+        # key's line only once however many ports it goes to
+        quantized = _quantize(value)
+        last_sent = self._last_sent
+        lines: Dict[str, bytes] = {}
+        send_if_changed = self._send_if_changed
+        debug = log.isEnabledFor(logging.DEBUG)
+        for port, key in sends:
+            if last_sent.get((port, key)) == quantized:
+                continue
+            line = lines.get(key)
+            if line is None:
+                line = lines[key] = self._format_value_line(key, value)
+            if debug:
+                log.debug("Sending dataref %s = %.4f to device %s with key %s",
+                         dataref, value, port, key)
+            send_if_changed(port, key, value, pending, quantized, line)
+
+        self._flush_writes(pending)
 
     def broadcast_by_key(self, key: str, value: Any) -> bool:
         """
@@ -582,15 +991,15 @@ class ArduinoManager:
             return False
         
         dataref_type = info.get("type", "")
+        kind = _classify_dataref_type(dataref_type)[0]
         
         # Handle based on dataref type
-        if dataref_type == "command":
+        if kind == "command":
             # Commands don't have values, just execute
             return self._execute_command(dataref)
-        elif "[" in dataref_type:
-            # Array type
+        elif kind == "array":
             return self._handle_array_dataref(dataref, dataref_type, value)
-        elif "string" in dataref_type or "byte" in dataref_type:
+        elif kind == "string":
             # String/byte type
             return self._handle_string_dataref(dataref, dataref_type, value)
         else:
@@ -610,10 +1019,15 @@ class ArduinoManager:
             return
 
         with self._lock:
-            ports = [p for p, d in self._devices.items() if d.is_ready]
+            ports = self._ready_serial_ports()
 
+        # Same key and value for every port: encode the line once
+        pending: Dict[str, bytearray] = {}
+        quantized = _quantize(float_value)
+        line = self._format_value_line(key, float_value)
         for port in ports:
-            self._send_if_changed(port, key, float_value)
+            self._send_if_changed(port, key, float_value, pending, quantized, line)
+        self._flush_writes(pending)
 
     def _get_dataref_by_key(self, key: str) -> Optional[str]:
         """Find the dataref associated with an OUTPUT ID key."""
@@ -629,8 +1043,7 @@ class ArduinoManager:
             return False
         
         try:
-            task = asyncio.create_task(self.xplane_conn.send_command(command))
-            self._tasks.append(task)  # Store task to prevent garbage collection
+            self._schedule(self.xplane_conn.send_command(command))
             log.info("Executed command: %s", command)
             return True
         except Exception as e:
@@ -643,14 +1056,11 @@ class ArduinoManager:
             log.warning("No X-Plane connection available for array dataref: %s", dataref)
             return False
         
-        # Parse array size
-        match = re.search(r'\[(\d+)\]', dataref_type)
-        if not match:
+        array_size = _classify_dataref_type(dataref_type)[1]
+        if array_size is None:
             log.warning("Invalid array type: %s", dataref_type)
             return False
         
-        array_size = int(match.group(1))
-        
         try:
             # Handle different array types
             if isinstance(value, (list, tuple)):
@@ -659,22 +1069,18 @@ class ArduinoManager:
                     log.warning("Value list too long for array of size %d", array_size)
                     value = value[:array_size]
                 
-                # Write each element
-                tasks = []
-                for i, val in enumerate(value):
-                    indexed_dataref = f"{dataref}[{i}]"
-                    float_val = float(val)
-                    task = asyncio.create_task(self.xplane_conn.write_dataref(indexed_dataref, float_val))
-                    tasks.append(task)
-
-                log.info("Wrote array %s with %d elements", dataref, len(value))
+                # Write all elements from one task
+                float_vals = [float(val) for val in value]
+                self._schedule(self.xplane_conn.write_dataref_array(dataref, float_vals))
+
+                log.debug("Wrote array %s with %d elements", dataref, len(value))
                 return True
             else:
                 # If value is a scalar, write to first element
                 indexed_dataref = f"{dataref}[0]"
                 float_val = float(value)
-                task = asyncio.create_task(self.xplane_conn.write_dataref(indexed_dataref, float_val))
-                log.info("Wrote scalar value to first element of array %s", dataref)
+                self._schedule(self.xplane_conn.write_dataref(indexed_dataref, float_val))
+                log.debug("Wrote scalar value to first element of array %s", dataref)
                 return True
         except (ValueError, TypeError) as e:
             log.error("Failed to write array dataref %s: %s", dataref, e)
@@ -686,14 +1092,11 @@ class ArduinoManager:
             log.warning("No X-Plane connection available for string dataref: %s", dataref)
             return False
         
-        # Parse array size
-        match = re.search(r'\[(\d+)\]', dataref_type)
-        if not match:
+        max_len = _classify_dataref_type(dataref_type)[1]
+        if max_len is None:
             log.warning("Invalid byte array type: %s", dataref_type)
             return False
         
-        max_len = int(match.group(1))
-        
         try:
             # Convert value to string if needed
             if not isinstance(value, str):
@@ -705,9 +1108,8 @@ class ArduinoManager:
                 value = value[:max_len]
             
             # Write string to dataref
-            task = asyncio.create_task(self.xplane_conn.write_dataref_string(dataref, value, max_len))
-            self._tasks.append(task)  # Store task to prevent garbage collection
-            log.info("Wrote string to dataref %s: %s", dataref, value)
+            self._schedule(self.xplane_conn.write_dataref_string(dataref, value, max_len))
+            log.debug("Wrote string to dataref %s: %s", dataref, value)
             return True
         except Exception as e:
             log.error("Failed to write string dataref %s: %s", dataref, e)
@@ -729,9 +1131,8 @@ class ArduinoManager:
                 float_val = float(value)
             
             # Write to dataref
-            task = asyncio.create_task(self.xplane_conn.write_dataref(dataref, float_val))
-            self._tasks.append(task)  # Store task to prevent garbage collection
-            log.info("Wrote scalar value to dataref %s: %s (%s)", dataref, value, dataref_type)
+            self._schedule(self.xplane_conn.write_dataref(dataref, float_val))
+            log.debug("Wrote scalar value to dataref %s: %s (%s)", dataref, value, dataref_type)
             return True
         except (ValueError, TypeError) as e:
             log.error("Failed to write scalar dataref %s: %s", dataref, e)
@@ -747,7 +1148,7 @@ class ArduinoManager:
         ser = None
 
         # Check if serial is available in this thread context
-        if not SERIAL_AVAILABLE:
+        if not _lazy_import_serial():
             log.error("Device loop error on %s: pyserial not available", port)
             device.transition(DeviceState.ERROR, "pyserial not available")
             self._notify_update()
@@ -762,7 +1163,7 @@ class ArduinoManager:
                 log.info("Attempting to open serial port: %s at baudrate: %d", device.port, device.baudrate)
 
                 # Create Serial instance with more detailed parameters
-                ser = Serial(
+                ser = _Serial_cls(
                     port=device.port,
                     baudrate=device.baudrate,
                     bytesize=8,
@@ -784,7 +1185,7 @@ class ArduinoManager:
                 else:
                     log.warning("Serial port may not be open: %s", device.port)
 
-            except SerialException as e:
+            except _SerialException as e:
                 log.error("SerialException when opening port %s: %s", device.port, e)
                 device.transition(DeviceState.ERROR, f"Cannot open port: {e}")
                 self._notify_update()
@@ -795,6 +1196,8 @@ class ArduinoManager:
                 self._notify_update()
                 return
             
+            self._enable_low_latency(ser, port)
+
             with self._lock:
                 self._serials[port] = ser
             
@@ -821,14 +1224,18 @@ class ArduinoManager:
             log.info("Device ready on %s: %s %s (%s)", 
                      port, device.board_type, device.firmware_version, device.device_name)
             
-            # Main communication loop
-            while device.state in (DeviceState.READY, DeviceState.ACTIVE):
+            # Main communication loop. Reads block in the driver for up to
+            # _READ_TIMEOUT, which also bounds how long a disconnect takes to
+            # be noticed; no sleep between passes.
+            try:
+                ser.timeout = self._READ_TIMEOUT
+            except Exception as e:
+                log.warning("Could not set read timeout on %s: %s", port, e)
+            while device.state in READY_STATES:
                 try:
                     self._process_incoming(device, ser)
-                except SerialException:
+                except _SerialException:
                     break
-                
-                time.sleep(0.010)
         
         except Exception as e:
             log.error("Device loop error on %s: %s", port, e)
@@ -844,12 +1251,30 @@ class ArduinoManager:
                 except Exception:
                     pass
             
-            if device.state not in (DeviceState.DISCONNECTED, DeviceState.ERROR):
+            if device.state not in STOPPED_STATES:
                 device.transition(DeviceState.DISCONNECTED)
             
             self._notify_update()
             log.info("Device loop ended for %s", port)
     
+    @staticmethod
+    def _enable_low_latency(ser, port: str) -> None:
+        """Ask the serial driver to deliver bytes without batching them.
+
+        USB-serial adapters (FTDI in particular) otherwise hold incoming data
+        for their latency timer, 16 ms by default. pyserial only supports this
+        on Linux; elsewhere, and on ports whose driver refuses it, the port is
+        left as it is.
+        """
+        set_low_latency = getattr(ser, 'set_low_latency_mode', None)
+        if set_low_latency is None:
+            return
+        try:
+            set_low_latency(True)
+            log.debug("Low latency mode enabled on %s", port)
+        except (OSError, ValueError) as e:
+            log.debug("Low latency mode not available on %s: %s", port, e)
+
     def _perform_handshake(self, device: ArduinoDevice, ser) -> bool:
         """Perform handshake with device."""
         try:
@@ -886,22 +1311,32 @@ class ArduinoManager:
                 pass
             log.debug("Sent %d bytes to %s", bytes_written, device.port)
 
-            # Wait for response
-            start = time.time()
-            while time.time() - start < 5.0:
-                if hasattr(ser, 'in_waiting') and ser.in_waiting > 0:
-                    log.debug("Data available on %s: %d bytes", device.port, ser.in_waiting)
-                    line = ser.readline().decode(errors="ignore").strip()
-                    log.debug("Received from %s: %s", device.port, repr(line))
-
-                    if line and line.startswith("XPDR"):
-                        # Handshake format: XPDR;fw=1.0;board=ESP32S2;name=FGCP
-                        log.info("Handshake successful on %s: %s", device.port, line)
-                        self._parse_handshake(device, line)
-                        return True
-                else:
-                    # Small delay to prevent busy-waiting
-                    time.sleep(0.1)
+            # Wait for response. Reads block for up to the port's timeout,
+            # so there is no sleep between polls; bytes accumulate until a
+            # complete XPDR line is in the buffer.
+            buf = bytearray()
+            deadline = time.monotonic() + 5.0
+            while time.monotonic() < deadline:
+                data = ser.read(max(1, getattr(ser, 'in_waiting', 0)))
+                if not data:
+                    continue
+                log.debug("Received from %s: %r", device.port, data)
+                buf += data
+
+                match = _HANDSHAKE_RE.search(buf)
+                if match:
+                    # Handshake format: XPDR;fw=1.0;board=ESP32S2;name=FGCP
+                    line = match.group().decode(errors="ignore").strip()
+                    log.info("Handshake successful on %s: %s", device.port, line)
+                    self._parse_handshake(device, line)
+                    # Whatever followed the handshake belongs to the device loop
+                    device._rx_buf[:] = buf[match.end():]
+                    return True
+
+                # Drop complete lines that were not the handshake (boot noise)
+                end = buf.rfind(b"\n")
+                if end >= 0:
+                    del buf[:end + 1]
 
             log.warning("Handshake timeout on %s after 5 seconds", device.port)
             log.debug("Port in_waiting: %s", getattr(ser, 'in_waiting', 'not available'))
@@ -909,104 +1344,139 @@ class ArduinoManager:
 
         except Exception as e:
             log.error("Handshake error on %s: %s", device.port, e)
-            import traceback
             log.error("Handshake traceback: %s", traceback.format_exc())
             return False
     
+    # Handshake field -> ArduinoDevice attribute it is stored in
+    _HANDSHAKE_FIELDS = {"fw": "firmware_version", "board": "board_type", "name": "device_name"}
+
     def _parse_handshake(self, device: ArduinoDevice, line: str) -> None:
         """Parse handshake response."""
-        parts = line.split(";")
-        
-        for part in parts[1:]:
-            if "=" in part:
-                key, val = part.split("=", 1)
-                if key == "fw":
-                    device.firmware_version = val
-                elif key == "board":
-                    device.board_type = val
-                    device.device_type = self._detect_device_type(val)
-                elif key == "name":
-                    device.device_name = val
+        for part in line.split(";")[1:]:
+            key, sep, value = part.partition("=")
+            attr = self._HANDSHAKE_FIELDS.get(key)
+            if not sep or attr is None:
+                continue
+            setattr(device, attr, value)
+            if key == "board":
+                device.device_type = self._detect_device_type(value)
     
+    # Board name substrings in match order: the more specific ESP32 variants
+    # must be tested before plain "esp32"
+    _BOARD_TYPES = (
+        ("esp32s2", DeviceType.ESP32S2),
+        ("esp32s3", DeviceType.ESP32S3),
+        ("esp32", DeviceType.ESP32),
+        ("leonardo", DeviceType.ARDUINO_LEONARDO),
+        ("micro", DeviceType.ARDUINO_PRO_MICRO),
+        ("nano", DeviceType.ARDUINO_NANO),
+    )
+
     def _detect_device_type(self, board: str) -> DeviceType:
         """Detect device type from board string."""
         board_lower = board.lower()
-        
-        if "esp32s2" in board_lower:
-            return DeviceType.ESP32S2
-        elif "esp32s3" in board_lower:
-            return DeviceType.ESP32S3
-        elif "esp32" in board_lower:
-            return DeviceType.ESP32
-        elif "leonardo" in board_lower:
-            return DeviceType.ARDUINO_LEONARDO
-        elif "micro" in board_lower:
-            return DeviceType.ARDUINO_PRO_MICRO
-        elif "nano" in board_lower:
-            return DeviceType.ARDUINO_NANO
-        else:
-            return DeviceType.UNKNOWN
+        return next((device_type for needle, device_type in self._BOARD_TYPES
+                     if needle in board_lower), DeviceType.UNKNOWN)
     
+    # Serial read timeout in the device loop, in seconds
+    _READ_TIMEOUT = 0.05
+
+    # A partial line longer than this is treated as noise and discarded
+    _RX_LINE_MAX = 4096
+
     def _process_incoming(self, device: ArduinoDevice, ser) -> None:
-        """Process incoming messages from device."""
-        while ser.in_waiting:
+        """Process incoming messages from device: every message waiting on the port."""
+        # Block for the first byte (up to the port's read timeout), then take
+        # everything else waiting in one read. Complete lines are handled and
+        # any trailing partial line stays on the device for the next pass.
+        data = ser.read(1)
+        if not data:
+            return
+        waiting = ser.in_waiting
+        if waiting:
+            data += ser.read(waiting)
+        buf = device._rx_buf
+        buf += data
+        end = buf.rfind(b"\n")
+        if end < 0:
+            if len(buf) > self._RX_LINE_MAX:
+                log.warning("Dropping %d bytes without a newline from %s", len(buf), device.port)
+                buf.clear()
+            return
+        # bytes, not bytearray: each line's tag is looked up in _dispatch
+        lines = bytes(buf[:end]).split(b"\n")
+        del buf[:end + 1]
+
+        # One clock reading and one last_seen update for the whole pass; a
+        # complete line, even a blank one, shows the device is alive
+        now = time.monotonic()
+        device.last_seen = now
+        # Bound once per pass rather than looked up per line
+        on_message = self.on_message_received
+        handle_input = self._handle_input
+        dispatch = self._dispatch
+        for raw in lines:
             try:
-                line = ser.readline().decode(errors="ignore").strip()
+                line = raw.strip()
                 if not line:
                     continue
                 
-                device.last_seen = time.time()
-                
                 if device.state == DeviceState.READY:
-                    device.transition(DeviceState.ACTIVE)
+                    device.transition(DeviceState.ACTIVE, now=now)
                     self._notify_update()
                 
                 # Notify raw message listeners
-                if self.on_message_received:
-                    self.on_message_received(device.port, line)
+                if on_message:
+                    on_message(device.port, line.decode(errors="ignore"))
                 
-                # Parse specific message types
-                if line.startswith("INPUT "):
-                    self._handle_input(device, line)
-                elif line.startswith("DREF "):
-                    self._handle_dref(device, line)
-                elif line.startswith("STRING "):
-                    self._handle_string(device, line)
-                elif line.startswith("CMD "):
-                    self._handle_cmd(device, line)
-                elif line.startswith("ACK "):
-                    log.debug("ACK from %s: %s", device.port, line)
-                elif line.startswith("STATUS"):
-                    log.debug("Status from %s: %s", device.port, line)
+                # Parse specific message types by their leading tag, compared
+                # as bytes; only the payload is decoded. INPUT, by far the
+                # most frequent, is checked first
+                tag, _, rest = line.partition(b" ")
+                if tag == b"INPUT":
+                    handle_input(device, rest.decode(errors="ignore"))
+                else:
+                    handler = dispatch.get(tag)
+                    if handler is not None:
+                        handler(device, rest.decode(errors="ignore"))
                     
             except Exception as e:
                 log.error("Error processing message from %s: %s", device.port, e)
     
-    def _handle_input(self, device: ArduinoDevice, line: str) -> None:
-        """Handle INPUT message from device."""
-        # Format: INPUT <key> <value>
-        parts = line.split()
-        if len(parts) < 3:
+    def _handle_input(self, device: ArduinoDevice, rest: str) -> None:
+        """Handle INPUT message from device; ``rest`` is the text after the tag."""
+        # Format: INPUT <key> <value>; the value may itself contain spaces
+        parts = rest.split(None, 1)
+        if len(parts) < 2:
             return
+        key, value_str = parts
+        value_str = value_str.rstrip()
             
-        key = parts[1]
-        value_str = ' '.join(parts[2:])  # Join all remaining parts in case value contains spaces
+        # Interned so the per-key dict lookups downstream hit on identity
+        key = sys.intern(key)
         
-        try:
-            self._handle_numeric_input(device, key, value_str)
-        except ValueError:
-            self._handle_string_input(device, key, value_str)
+        if value_str[0] in _NUMERIC_LEAD:
+            try:
+                self._handle_numeric_input(device, key, value_str)
+                return
+            except ValueError:
+                pass
+        # Collapse runs of whitespace, as the device text is not re-split
+        self._handle_string_input(device, key, ' '.join(value_str.split()))
     
     def _handle_numeric_input(self, device: ArduinoDevice, key: str, value_str: str):
         """Handle numeric input from device."""
         value = float(value_str)
+        # Stored before any notification, so listeners reading the device
+        # see this value
         device.set_input(key, value)
         
         self._update_variable_store(key, value, device.port)
         self._forward_to_xplane(key, value)
         self._notify_listeners(device.port, key, value)
         
-        log.debug("Input from %s: %s = %.4f", device.port, key, value)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Input from %s: %s = %.4f", device.port, key, value)
     
     def _handle_string_input(self, device: ArduinoDevice, key: str, string_value: str):
         """Handle string input from device."""
@@ -1014,12 +1484,12 @@ class ArduinoManager:
         self._forward_to_xplane(key, string_value, is_string=True)
         self._notify_listeners(device.port, key, -999.0)  # Special value to indicate string
         
-        log.debug("Input string from %s: %s = %s", device.port, key, string_value)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Input string from %s: %s = %s", device.port, key, string_value)
     
     def _update_variable_store(self, key: str, value, port: str, is_string: bool = False):
         """Update variable store if available."""
         if self.variable_store:
-            from core.variable_store import VariableType
             source = f"Input from Arduino device on {port}" + (" (string)" if is_string else "")
             self.variable_store.update_value(key, value, VariableType.VARIABLE_ARDUINO, source)
     
@@ -1029,12 +1499,8 @@ class ArduinoManager:
             return
             
         # Look up the dataref associated with this key in universal mappings
-        dataref_info = None
-        for mapped_key, info in self._universal_mappings.items():
-            if mapped_key == key.upper():
-                dataref_info = info
-                break
-                
+        # (set_universal_mapping stores keys uppercased)
+        dataref_info = self._universal_mappings.get(key.upper())
         if not dataref_info:
             return
             
@@ -1046,49 +1512,24 @@ class ArduinoManager:
     
     def _send_to_xplane(self, dataref: str, value, is_string: bool = False):
         """Send data to X-Plane with proper async handling."""
-        import asyncio
-        try:
-            loop = asyncio.get_running_loop()
-            if is_string:
-                task = loop.create_task(self.xplane_conn.write_dataref_string(dataref, value))
-                log.info("Scheduled INPUT string to X-Plane: %s = %s", dataref, value)
-            else:
-                task = loop.create_task(self.xplane_conn.write_dataref(dataref, value))
-                log.info("Scheduled INPUT to X-Plane: %s = %.4f", dataref, value)
-            self._tasks.append(task)
-        except RuntimeError:
-            import threading
-            def async_call():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    if is_string:
-                        coro = self.xplane_conn.write_dataref_string(dataref, value)
-                    else:
-                        coro = self.xplane_conn.write_dataref(dataref, value)
-                    new_loop.run_until_complete(coro)
-                finally:
-                    new_loop.close()
-                    
-            thread = threading.Thread(target=async_call, daemon=True)
-            thread.start()
+        self._queue_write(dataref, value, is_string)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Queued INPUT to X-Plane: %s = %s", dataref, value)
     
     def _notify_listeners(self, port: str, key: str, value: float):
         """Notify listeners of input received."""
-        if self.on_input_received:
-            self.on_input_received(port, key, value)
+        callback = self.on_input_received
+        if callback:
+            callback(port, key, value)
 
-    def _handle_dref(self, device: ArduinoDevice, line: str) -> None:
+    def _handle_dref(self, device: ArduinoDevice, rest: str) -> None:
         """Handle DREF message from device to set dataref value."""
         # Format: DREF sim/dataref 1.0
         # Split by FIRST space (DREF), then LAST space (Value) is safer
-        # Extract the part after "DREF "
-        data_part = line[5:].strip()
         # Split from the right side to separate dataref from value
-        parts = data_part.rsplit(' ', 1)
-        if len(parts) == 2:
-            dataref = parts[0].strip()
-            val_str = parts[1].strip()
+        dataref, sep, val_str = rest.strip().rpartition(' ')
+        if sep:
+            dataref = dataref.strip()
 
             try:
                 value = float(val_str)
@@ -1096,33 +1537,9 @@ class ArduinoManager:
                 # Forward the DREF command to X-Plane if connection is available
                 if self.xplane_conn:
                     try:
-                        # Call the write_dataref method directly (it's async but we'll handle it differently)
-                        # Schedule the coroutine in the main event loop if available
-                        import asyncio
-                        try:
-                            # Check if we're in an event loop
-                            loop = asyncio.get_running_loop()
-                            # If we're in a loop, schedule the task
-                            task = loop.create_task(self.xplane_conn.write_dataref(dataref, value))
-                            self._tasks.append(task)  # Store task to prevent garbage collection
-                            log.info("Scheduled DREF command to X-Plane: %s = %.4f", dataref, value)
-                        except RuntimeError:
-                            # No event loop running, call it synchronously if possible
-                            # For this case, we'll call the underlying method directly
-                            import threading
-                            def async_call():
-                                # Create a new event loop for this thread
-                                new_loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(new_loop)
-                                try:
-                                    coro = self.xplane_conn.write_dataref(dataref, value)
-                                    new_loop.run_until_complete(coro)
-                                finally:
-                                    new_loop.close()
-
-                            # Run in a separate thread
-                            thread = threading.Thread(target=async_call, daemon=True)
-                            thread.start()
+                        # Discrete write from firmware: sent as is, in order
+                        # with CMDs, never coalesced like INPUT values
+                        self._schedule(self.xplane_conn.write_dataref(dataref, value))
                     except Exception as xe:
                         log.error("Failed to forward DREF to X-Plane: %s", xe)
                 else:
@@ -1132,46 +1549,24 @@ class ArduinoManager:
                 if self.on_dataref_write:
                     self.on_dataref_write(dataref, value)
 
-                log.info("DREF command from %s: %s = %.4f", device.port, dataref, value)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("DREF command from %s: %s = %.4f", device.port, dataref, value)
             except ValueError:
                 log.error("Invalid float value from Arduino: '%s'", val_str)
         else:
-            log.error("Invalid DREF format: %s", line)
+            log.error("Invalid DREF format: DREF %s", rest)
 
-    def _handle_cmd(self, device: ArduinoDevice, line: str) -> None:
+    def _handle_cmd(self, device: ArduinoDevice, rest: str) -> None:
         """Handle CMD message from device to send X-Plane command."""
         # Format: CMD sim/cockpit/electrical/beacon_lights_toggle
         try:
-            # Extract the command after "CMD "
-            command = line[4:].strip()
+            command = rest.strip()
 
             # Forward the command to X-Plane if connection is available
             if self.xplane_conn:
                 try:
-                    import asyncio
-                    try:
-                        # Check if we're in an event loop
-                        loop = asyncio.get_running_loop()
-                        # If we're in a loop, schedule the task
-                        task = loop.create_task(self.xplane_conn.send_command(command))
-                        self._tasks.append(task)  # Store task to prevent garbage collection
+                    if self._schedule(self.xplane_conn.send_command(command)):
                         log.info("Scheduled CMD command to X-Plane: %s", command)
-                    except RuntimeError:
-                        # No event loop running, run in separate thread
-                        import threading
-                        def async_call():
-                            # Create a new event loop for this thread
-                            new_loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(new_loop)
-                            try:
-                                coro = self.xplane_conn.send_command(command)
-                                new_loop.run_until_complete(coro)
-                            finally:
-                                new_loop.close()
-
-                        # Run in a separate thread
-                        thread = threading.Thread(target=async_call, daemon=True)
-                        thread.start()
                 except Exception as xe:
                     log.error("Failed to forward CMD to X-Plane: %s", xe)
             else:
@@ -1185,58 +1580,67 @@ class ArduinoManager:
         except Exception as e:
             log.error("Error parsing CMD command: %s", e)
 
-    def _handle_string(self, device: ArduinoDevice, line: str) -> None:
+    def _handle_string(self, device: ArduinoDevice, rest: str) -> None:
         """Handle STRING message from device to set string dataref value."""
         # Format: STRING sim/dataref_name text_value
         try:
-            # Extract the part after "STRING "
-            data_part = line[7:].strip()
             # Split from the right side to separate dataref from string value
-            parts = data_part.rsplit(' ', 1)
-            if len(parts) == 2:
-                dataref = parts[0].strip()
-                string_val = parts[1].strip()
+            dataref, sep, string_val = rest.strip().rpartition(' ')
+            if sep:
+                dataref = dataref.strip()
 
                 # Forward the STRING command to X-Plane if connection is available
                 if self.xplane_conn:
                     try:
-                        # Call the write_dataref_string method directly
-                        import asyncio
-                        try:
-                            # Check if we're in an event loop
-                            loop = asyncio.get_running_loop()
-                            # If we're in a loop, schedule the task
-                            task = loop.create_task(self.xplane_conn.write_dataref_string(dataref, string_val))
-                            self._tasks.append(task)  # Store task to prevent garbage collection
-                            log.info("Scheduled STRING command to X-Plane: %s = %s", dataref, string_val)
-                        except RuntimeError:
-                            # No event loop running, run in separate thread
-                            import threading
-                            def async_call():
-                                # Create a new event loop for this thread
-                                new_loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(new_loop)
-                                try:
-                                    coro = self.xplane_conn.write_dataref_string(dataref, string_val)
-                                    new_loop.run_until_complete(coro)
-                                finally:
-                                    new_loop.close()
-
-                            # Run in a separate thread
-                            thread = threading.Thread(target=async_call, daemon=True)
-                            thread.start()
+                        # Discrete write, sent in order like DREF
+                        self._schedule(self.xplane_conn.write_dataref_string(dataref, string_val))
                     except Exception as xe:
                         log.error("Failed to forward STRING to X-Plane: %s", xe)
                 else:
                     log.warning("No X-Plane connection available for STRING command: %s", dataref)
 
-                log.info("STRING command from %s: %s = %s", device.port, dataref, string_val)
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("STRING command from %s: %s = %s", device.port, dataref, string_val)
             else:
-                log.error("Invalid STRING format: %s", line)
+                log.error("Invalid STRING format: STRING %s", rest)
         except Exception as e:
             log.error("Error parsing STRING command: %s", e)
 
-    def _notify_update(self) -> None:
-        """Notify listeners of device state change."""
+    def _handle_ack(self, device: ArduinoDevice, rest: str) -> None:
+        log.debug("ACK from %s: ACK %s", device.port, rest)
+
+    def _handle_status(self, device: ArduinoDevice, rest: str) -> None:
+        log.debug("Status from %s: STATUS %s", device.port, rest)
+
+    # Delay between a device state change and the notification covering it
+    _NOTIFY_INTERVAL = 0.05
+
+    def _notify_update(self, urgent: bool = False) -> None:
+        """Notify listeners of device state change.
+
+        State changes come in bursts (CONNECTING, HANDSHAKE, READY, ACTIVE),
+        so unless urgent, one snapshot goes out _NOTIFY_INTERVAL after the
+        first change, from the background loop, covering all changes since.
+        """
+        if not self.on_device_update:
+            return
+        if urgent:
+            self._emit_device_update()
+            return
+        with self._notify_lock:
+            if self._notify_pending:
+                return
+            self._notify_pending = True
+        loop = self._get_bg_loop()
+        loop.call_soon_threadsafe(loop.call_later, self._NOTIFY_INTERVAL,
+                                  self._emit_device_update)
+
+    def _emit_device_update(self) -> None:
+        """Send the current device snapshot to the update listener."""
+        with self._notify_lock:
+            self._notify_pending = False
         if self.on_device_update:
-            self.on_device_update(self.devices_snapshot())
+            try:
+                self.on_device_update(self.devices_snapshot())
+            except Exception as e:
+                log.error("Device update listener failed: %s", e)
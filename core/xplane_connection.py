@@ -333,6 +333,17 @@ class XPlaneConnection:
             log.error("Failed to write dataref %s: %s", dataref, e)
             return False
 
+    async def write_dataref_array(self, dataref: str, values: List[float]) -> bool:
+        """
+        Writes values to the elements of an array dataref, starting at index 0.
+        A DREF packet carries a single value, so this still sends one packet per
+        element, but from one coroutine instead of one task per element.
+        """
+        ok = True
+        for i, value in enumerate(values):
+            ok = await self.write_dataref(f"{dataref}[{i}]", value) and ok
+        return ok
+
     async def write_dataref_string(
         self, dataref: str, string_value: str, max_len: int = 0
     ) -> bool:
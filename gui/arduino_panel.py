@@ -422,7 +422,7 @@ class ArduinoPanel(QWidget):
 
     def auto_connect(self, ports: List[str]):
         """Attempt to auto-connect to a list of ports."""
-        available = [p['port'] for p in self.arduino_manager.list_ports()]
+        available = [p['port'] for p in self.arduino_manager.list_ports(frozenset({'port'}))]
 
         for port in ports:
             if port in available and port not in self._device_widgets:
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Regression tests for ArduinoManager's device message handling.
+Runs without hardware or pyserial: a fake port feeds raw bytes to the read path.
+"""
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.arduino.arduino_manager import ArduinoManager
+from core.arduino.arduino_device import ArduinoDevice, DeviceState
+
+
+class FakeSerial:
+    """Serial stand-in that returns the given lines from read()."""
+
+    def __init__(self, lines):
+        self.buf = b"".join(line.encode() + b"\n" for line in lines)
+
+    @property
+    def in_waiting(self):
+        return len(self.buf)
+
+    def read(self, size=1):
+        data, self.buf = self.buf[:size], self.buf[size:]
+        return data
+
+
+class ProcessIncomingTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = ArduinoManager()
+        self.device = ArduinoDevice("COM9")
+        self.device.transition(DeviceState.READY)
+        self.manager._devices["COM9"] = self.device
+
+    def test_cmd_line_is_dispatched(self):
+        commands = []
+        self.manager.on_command_send = commands.append
+
+        self.manager._process_incoming(
+            self.device, FakeSerial(["CMD sim/lights/beacon_lights_toggle"])
+        )
+
+        self.assertEqual(commands, ["sim/lights/beacon_lights_toggle"])
+
+    def test_dref_line_is_dispatched(self):
+        writes = []
+        self.manager.on_dataref_write = lambda dataref, value: writes.append((dataref, value))
+
+        self.manager._process_incoming(self.device, FakeSerial(["DREF sim/test/value 1.5"]))
+
+        self.assertEqual(writes, [("sim/test/value", 1.5)])
+
+    def test_input_is_stored_before_listeners_run(self):
+        seen = []
+        self.manager.on_input_received = lambda port, key, value: seen.append(
+            (key, value, self.device.get_input(key))
+        )
+
+        self.manager._process_incoming(self.device, FakeSerial(["INPUT BTN1 1", "INPUT BTN1 0"]))
+
+        self.assertEqual(seen, [("BTN1", 1.0, 1.0), ("BTN1", 0.0, 0.0)])
+
+    def test_input_key_and_value_may_be_tab_separated(self):
+        seen = []
+        self.manager.on_input_received = lambda port, key, value: seen.append((key, value))
+
+        self.manager._process_incoming(self.device, FakeSerial(["INPUT BTN1\t1"]))
+
+        self.assertEqual(seen, [("BTN1", 1.0)])
+        self.assertEqual(self.device.get_input("BTN1"), 1.0)
+
+    def test_dref_writes_are_sent_in_order_with_commands(self):
+        sent = []
+
+        class FakeXPlane:
+            async def write_dataref(self, dataref, value):
+                sent.append(("DREF", dataref, value))
+
+            async def send_command(self, command):
+                sent.append(("CMD", command))
+
+        self.manager.xplane_conn = FakeXPlane()
+
+        async def run():
+            self.manager._process_incoming(
+                self.device,
+                FakeSerial(["DREF sim/btn 1", "DREF sim/btn 0", "CMD sim/test/cmd"]),
+            )
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+
+        self.assertEqual(
+            sent,
+            [("DREF", "sim/btn", 1.0), ("DREF", "sim/btn", 0.0), ("CMD", "sim/test/cmd")],
+        )
+
+
+class FailingSerial:
+    """Serial stand-in whose writes always fail."""
+
+    def write(self, data):
+        raise OSError("device gone")
+
+
+class ClosingSerial:
+    """Serial stand-in that records close()."""
+
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class LastSentTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = ArduinoManager()
+        self.device = ArduinoDevice("COM9")
+        self.device.transition(DeviceState.READY)
+        self.manager._devices["COM9"] = self.device
+        self.manager._serials["COM9"] = FailingSerial()
+
+    def test_failed_write_forgets_only_that_port(self):
+        last_sent = self.manager._last_sent
+        last_sent[("COM8", "ALT")] = 1.0
+
+        pending = {}
+        self.manager._send_if_changed("COM9", "ALT", 2.0, pending)
+        self.manager._flush_writes(pending)
+
+        self.assertEqual(last_sent, {("COM8", "ALT"): 1.0})
+        # Forgotten in place; holders of the dict see the same entries
+        self.assertIs(self.manager._last_sent, last_sent)
+
+    def test_disconnect_closes_port_and_forgets_values(self):
+        ser = ClosingSerial()
+        self.manager._serials["COM9"] = ser
+        self.manager._last_sent[("COM9", "ALT")] = 1.0
+        self.manager._last_sent[("COM8", "ALT")] = 1.0
+
+        self.manager.disconnect("COM9")
+
+        self.assertTrue(ser.closed)
+        self.assertNotIn("COM9", self.manager._serials)
+        self.assertEqual(self.manager._last_sent, {("COM8", "ALT"): 1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()